@@ -0,0 +1,231 @@
+"""On-disk response cache for claim extraction"""
+
+import atexit
+import hashlib
+import io
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class ClaimCache:
+    """
+    Two-tier cache for raw claim-extraction responses.
+
+    Tier 1 is an exact match on SHA-256(model, prompt_version, prompt).
+    Tier 2 is a semantic match: the chunk is embedded with ``embed_fn`` and the
+    nearest stored embedding is returned if its cosine similarity is at least
+    ``similarity_threshold``. Entries hold the raw JSON response text rather
+    than ClaimObjects, so callers re-parse them with the current chunk_id.
+
+    Responses are written on every ``put``; new embeddings are buffered and the
+    index files are rewritten once per ``flush_every`` puts, on ``flush()``,
+    and at interpreter exit. All files are replaced atomically, and a flush
+    merges with the on-disk index so processes can share ``cache_dir``.
+
+    Layout of ``cache_dir``:
+        responses/<key>.json   {"content": <raw response text>}
+        embeddings.npy         (n, d) float32, L2-normalized
+        embedding_keys.json    [<key>, ...] aligned with embeddings.npy rows
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        embed_fn: Optional[Callable[[str], List[float]]] = None,
+        similarity_threshold: float = 0.97,
+        flush_every: int = 64,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.responses_dir = self.cache_dir / "responses"
+        self.responses_dir.mkdir(parents=True, exist_ok=True)
+        self.embed_fn = embed_fn
+        self.similarity_threshold = similarity_threshold
+        self.flush_every = flush_every
+        self.exact_hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # Embeddings computed on a miss, reused by the following put() for that key
+        self._pending_vectors: Dict[str, np.ndarray] = {}
+        self._embeddings, self._embedding_keys = self._load_index()
+        # Vectors added since the last flush; their keys are already the
+        # trailing entries of _embedding_keys
+        self._unflushed_vectors: List[np.ndarray] = []
+        atexit.register(self.flush)
+
+    @staticmethod
+    def make_key(model: str, prompt_version: str, prompt: str) -> str:
+        """Exact-match key for a prompt under a given model and prompt version."""
+        payload = f"{model}\x00{prompt_version}\x00{prompt}".encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()
+
+    def _load_index(self):
+        embeddings_path = self.cache_dir / "embeddings.npy"
+        keys_path = self.cache_dir / "embedding_keys.json"
+        if embeddings_path.exists() and keys_path.exists():
+            try:
+                embeddings = np.load(embeddings_path)
+                with open(keys_path, 'r', encoding='utf-8') as f:
+                    keys = json.load(f)
+                if len(keys) == embeddings.shape[0]:
+                    return embeddings, keys
+            except Exception as e:
+                print(f"Warning: could not load claim cache index: {e}")
+        return None, []
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        # Readers (and other processes sharing cache_dir) never see a partial file
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _save_index(self) -> None:
+        buffer = io.BytesIO()
+        np.save(buffer, self._embeddings)
+        self._write_atomic(self.cache_dir / "embeddings.npy", buffer.getvalue())
+        self._write_atomic(
+            self.cache_dir / "embedding_keys.json",
+            json.dumps(self._embedding_keys).encode("utf-8"),
+        )
+
+    def _flush_locked(self) -> None:
+        if not self._unflushed_vectors:
+            return
+        rows = [np.stack(self._unflushed_vectors)]
+        if self._embeddings is not None:
+            rows.insert(0, self._embeddings)
+        embeddings = np.vstack(rows)
+        keys = self._embedding_keys
+
+        # Other processes using the same cache_dir (process_pdf_directory runs
+        # one cache per worker) may have flushed since this index was loaded,
+        # so merge with the on-disk index instead of overwriting it.
+        disk_embeddings, disk_keys = self._load_index()
+        if disk_embeddings is not None:
+            known = set(disk_keys)
+            missing = [i for i, key in enumerate(keys) if key not in known]
+            embeddings = np.vstack([disk_embeddings, embeddings[missing]])
+            keys = disk_keys + [keys[i] for i in missing]
+
+        self._embeddings = embeddings
+        self._embedding_keys = keys
+        self._unflushed_vectors = []
+        self._save_index()
+
+    def flush(self) -> None:
+        """Write buffered embeddings to the on-disk index."""
+        with self._lock:
+            try:
+                self._flush_locked()
+            except Exception as e:
+                print(f"Warning: could not save claim cache index: {e}")
+
+    def _read_response(self, key: str) -> Optional[str]:
+        """Cached response for key, or None if missing or unreadable."""
+        path = self.responses_dir / f"{key}.json"
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f).get("content")
+        except Exception as e:
+            print(f"Warning: could not read claim cache entry {path}: {e}")
+            return None
+
+    def _embed(self, chunk_text: str) -> Optional[np.ndarray]:
+        """Normalized embedding for chunk_text, or None if embedding is unavailable."""
+        if self.embed_fn is None:
+            return None
+        try:
+            vector = np.asarray(self.embed_fn(chunk_text), dtype=np.float32)
+        except Exception as e:
+            print(f"Warning: claim cache embedding failed: {e}")
+            return None
+        norm = np.linalg.norm(vector)
+        if norm == 0:
+            return None
+        return vector / norm
+
+    def lookup(
+        self,
+        key: str,
+        chunk_text: str,
+        accept: Optional[Callable[[str], bool]] = None,
+    ) -> Tuple[Optional[str], bool]:
+        """
+        Return (raw response, is_semantic) for the chunk; the response is None
+        on a miss. Semantic hits were produced for a different chunk, so they
+        are only returned if ``accept(content)`` (when given) is true; a
+        rejected candidate counts as a miss.
+        """
+        content = self._read_response(key)
+        if content is not None:
+            with self._lock:
+                self.exact_hits += 1
+            return content, False
+
+        vector = self._embed(chunk_text)
+        candidate_key = None
+        with self._lock:
+            if vector is not None and self._embedding_keys:
+                similarities = []
+                if self._embeddings is not None:
+                    similarities.append(self._embeddings @ vector)
+                if self._unflushed_vectors:
+                    similarities.append(np.stack(self._unflushed_vectors) @ vector)
+                similarities = np.concatenate(similarities)
+                best = int(np.argmax(similarities))
+                if similarities[best] >= self.similarity_threshold:
+                    candidate_key = self._embedding_keys[best]
+
+        if candidate_key is not None:
+            content = self._read_response(candidate_key)
+            if content is not None and accept is not None and not accept(content):
+                content = None
+
+        with self._lock:
+            if content is not None:
+                self.semantic_hits += 1
+            else:
+                self.misses += 1
+                if vector is not None:
+                    self._pending_vectors[key] = vector
+        return content, content is not None
+
+    def get(self, key: str, chunk_text: str) -> Optional[str]:
+        """Return a cached raw response for the chunk, or None on a miss."""
+        return self.lookup(key, chunk_text)[0]
+
+    def put(self, key: str, chunk_text: str, content: str) -> None:
+        """Store a raw response under key and index its chunk embedding."""
+        self._write_atomic(
+            self.responses_dir / f"{key}.json",
+            json.dumps({"content": content}, ensure_ascii=False).encode("utf-8"),
+        )
+
+        with self._lock:
+            vector = self._pending_vectors.pop(key, None)
+        if vector is None:
+            vector = self._embed(chunk_text)
+        if vector is None:
+            return
+        with self._lock:
+            self._unflushed_vectors.append(vector)
+            self._embedding_keys.append(key)
+            if len(self._unflushed_vectors) >= self.flush_every:
+                self._flush_locked()
+
+    def get_stats(self) -> dict:
+        """Hit/miss counters for this cache instance."""
+        return {
+            "exact_hits": self.exact_hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+        }
@@ -9,11 +9,20 @@ Architecture:
 """
 
 import json
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
 from typing import List, Dict, Tuple, Optional
 from pathlib import Path
 
+try:
+    # orjson serializes large claim lists several times faster; json is the fallback
+    import orjson
+except ImportError:
+    orjson = None
+
 # Ensure project root is on sys.path so ``run_paths`` resolves when the module
 # is launched as ``python -m hybrid_citation_scraper.claim_extractor``.
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent
@@ -21,7 +30,14 @@ if str(_PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(_PROJECT_ROOT))
 
 from run_paths import RunPaths
-from .config import CLAIM_EXTRACTION_OUTPUT_DIR
+from .config import (
+    CLAIM_EXTRACTION_OUTPUT_DIR,
+    CLAIM_EXTRACTION_MAX_WORKERS,
+    USE_BATCH_API_FOR_CLAIMS,
+    BATCH_API_MIN_CHUNKS,
+    ENABLE_PDF_CACHE,
+    SKIP_NON_CANDIDATE_CHUNKS,
+)
 from .utils import (
     extract_text_from_pdf,
     extract_title_and_abstract,
@@ -29,11 +45,33 @@ from .utils import (
     detect_citation_style,
     parse_citations_deterministic,
     validate_citations,
-    semantic_chunk_text
+    semantic_chunk_text,
+    cached_extract,
+    pdf_cache_path,
+    save_pdf_cache
 )
 from .llm_client import LLMClient
 from models import ClaimObject, CitationDetails, LocationInText
 
+# Citation marker / reference-entry patterns, compiled once at import
+_NUMERIC_MARKER_RE = re.compile(r'\[(\d+)\]')
+_AUTHOR_MARKER_RE = re.compile(r'\(([A-Z][a-z]+)')
+_YEAR_RE = re.compile(r'\((\d{4})\)|(\d{4})')
+_DOI_RE = re.compile(r'doi[:\s]*(10\.\S+)', re.IGNORECASE)
+_URL_RE = re.compile(r'https?://\S+')
+_AUTHOR_DELIMITER_RE = re.compile(r'[,;&]')
+# Cheap pre-filter for chunks worth an LLM call: any citation marker, any
+# number (statistics, percentages, superscript markers flattened to digits), or
+# a typical claim verb. Chunks with none of these (headings, bare captions,
+# boilerplate) almost never yield claims.
+_CLAIM_CANDIDATE_RE = re.compile(
+    r'\[\d|\([A-Z][A-Za-z\-]+(?: et al\.)?,? \d{4}|\d'
+    r'|\b(?:show[ns]?|showed|demonstrat\w*|found|finds?|suggest\w*|indicat\w*'
+    r'|reveal\w*|increas\w*|decreas\w*|reduc\w*|improv\w*|caus\w*|associat\w*'
+    r'|correlat\w*|outperform\w*|significant\w*|evidence|report\w*)\b',
+    re.IGNORECASE
+)
+
 
 def _locate_claim_span(
     full_text: str, claim_text: str, hint: int = 0
@@ -73,6 +111,29 @@ def _locate_claim_span(
     return None, None
 
 
+def _chunk_is_claim_candidate(text: str) -> bool:
+    """True if the chunk has any marker, number, or claim verb worth sending to the LLM."""
+    return _CLAIM_CANDIDATE_RE.search(text) is not None
+
+
+def _summarize_claims(claims: List[ClaimObject]) -> Dict[str, int]:
+    """Tally claim counts by type and citation status in a single pass."""
+    quantitative = qualitative = cited = 0
+    for claim in claims:
+        if claim.claim_type == "quantitative":
+            quantitative += 1
+        elif claim.claim_type == "qualitative":
+            qualitative += 1
+        if claim.citation_found:
+            cited += 1
+    return {
+        "total_claims": len(claims),
+        "quantitative_claims": quantitative,
+        "qualitative_claims": qualitative,
+        "claims_with_citations": cited,
+    }
+
+
 class HybridClaimExtractor:
     """
     Hybrid citation scraper using deterministic pipeline + LLM augmentation.
@@ -84,8 +145,10 @@ class HybridClaimExtractor:
     4. Citation Mapping: Deterministic marker matching
     """
     
-    def __init__(self):
-        self.llm_client = LLMClient()
+    def __init__(self, rate_limit_share: float = 1.0):
+        # Chunk requests run concurrently; the client's rate limiter keeps them
+        # within this extractor's share of the Gemini quota.
+        self.llm_client = LLMClient(rate_limit_share=rate_limit_share)
         self.citations = {}
         self.claims = []
         self.paper_title = None
@@ -96,18 +159,42 @@ class HybridClaimExtractor:
         Extract citations from PDF using hybrid approach.
         Returns dict mapping citation_id -> citation_text
         """
-        print("Extracting text from PDF...")
-        full_text = extract_text_from_pdf(pdf_path)
+        if ENABLE_PDF_CACHE:
+            cache_path = pdf_cache_path(pdf_path)
+            entry = cached_extract(pdf_path, cache_path)
+            if entry.get('citations'):
+                self.citations = entry['citations']
+                print(f"✓ Loaded {len(self.citations)} cached citations")
+                return self.citations
+            full_text = entry['text']
+        else:
+            print("Extracting text from PDF...")
+            full_text = extract_text_from_pdf(pdf_path)
         
         print("Locating reference section...")
         ref_section = locate_reference_section(full_text)
-        
+        self.extract_citations_from_text(full_text, ref_section)
+        if ENABLE_PDF_CACHE and self.citations:
+            save_pdf_cache(pdf_path, cache_path, entry, citations=self.citations)
+        return self.citations
+    
+    def extract_citations_from_text(self, full_text: str, ref_section: Optional[str]) -> Dict[str, str]:
+        """
+        Parse citations from already-extracted text: deterministic first, LLM fallback.
+        ``ref_section`` is the result of ``locate_reference_section(full_text)``
+        (None if no reference section was found), so callers that need it for
+        other purposes locate it only once.
+        """
+        self.citations = self._parse_citations(full_text, ref_section)
+        return self.citations
+    
+    def _parse_citations(self, full_text: str, ref_section: Optional[str]) -> Dict[str, str]:
+        """Deterministic parse of ref_section with LLM fallback; returns the citations."""
         if not ref_section:
             print("⚠️  Could not locate reference section deterministically")
             print("Using LLM fallback to extract references...")
             # locate_reference_section already tried fallback, use full text
-            self.citations = self.llm_client.parse_references_with_llm(full_text)
-            return self.citations
+            return self.llm_client.parse_references_with_llm(full_text)
         
         print("Detecting citation style...")
         citation_style = detect_citation_style(ref_section)
@@ -120,8 +207,7 @@ class HybridClaimExtractor:
                 
                 if validate_citations(citations):
                     print(f"✓ Successfully parsed {len(citations)} citations")
-                    self.citations = citations
-                    return self.citations
+                    return citations
                 else:
                     print("⚠️  Parsed citations failed validation")
             except Exception as e:
@@ -129,10 +215,10 @@ class HybridClaimExtractor:
         
         # Fallback to LLM
         print("Using LLM fallback to parse references...")
-        self.citations = self.llm_client.parse_references_with_llm(ref_section)
-        print(f"✓ LLM parsed {len(self.citations)} citations")
+        citations = self.llm_client.parse_references_with_llm(ref_section)
+        print(f"✓ LLM parsed {len(citations)} citations")
         
-        return self.citations
+        return citations
     
     def extract_claims_from_text(self, text: str, chunk_size: int = 800) -> List[ClaimObject]:
         """
@@ -146,18 +232,25 @@ class HybridClaimExtractor:
         
         all_claims = []
         
-        print("Extracting claims from chunks...")
-        for i, chunk in enumerate(chunks):
-            print(f"  Processing chunk {i+1}/{len(chunks)}...")
-            
-            claims = self.llm_client.extract_claims_from_chunk(
-                chunk['text'],
-                chunk['chunk_id'],
-                available_citations=self.citations,
-                paper_title=self.paper_title,
-                paper_abstract=self.paper_abstract
-            )
-            
+        # Optionally skip chunks with no claim signals rather than paying for
+        # an LLM call that returns nothing.
+        candidates = chunks
+        if SKIP_NON_CANDIDATE_CHUNKS:
+            candidates = [chunk for chunk in chunks if _chunk_is_claim_candidate(chunk['text'])]
+        if len(candidates) < len(chunks):
+            print(f"Skipping {len(chunks) - len(candidates)} chunks with no claim candidates")
+        
+        claims_per_chunk = None
+        if USE_BATCH_API_FOR_CLAIMS and len(candidates) >= BATCH_API_MIN_CHUNKS:
+            try:
+                claims_per_chunk = self._extract_chunk_claims_batch(candidates)
+            except Exception as e:
+                print(f"⚠️  Batch claim extraction failed: {e}")
+                print("Falling back to realtime extraction...")
+        if claims_per_chunk is None:
+            claims_per_chunk = self._extract_chunk_claims_realtime(candidates)
+        
+        for chunk, claims in zip(candidates, claims_per_chunk):
             # Record each claim's exact character span in the full document
             # text so consumers can highlight it in the source. The chunk's
             # start_pos is only a search hint here — offsets are resolved
@@ -178,6 +271,38 @@ class HybridClaimExtractor:
         
         return all_claims
     
+    def _extract_chunk_claims_realtime(self, chunks: List[Dict]) -> List[List[ClaimObject]]:
+        """Run one LLM call per chunk concurrently; returns claim lists in chunk order."""
+        def extract_chunk(chunk: Dict) -> List[ClaimObject]:
+            claims = self.llm_client.extract_claims_from_chunk(
+                chunk['text'],
+                chunk['chunk_id'],
+                available_citations=self.citations,
+                paper_title=self.paper_title,
+                paper_abstract=self.paper_abstract
+            )
+            print(f"  ✓ Chunk {chunk['chunk_id'] + 1}: {len(claims)} claims")
+            return claims
+        
+        # Each chunk is one network-bound LLM call, so run them concurrently.
+        # executor.map preserves chunk order in the results.
+        workers = max(1, min(CLAIM_EXTRACTION_MAX_WORKERS, len(chunks)))
+        print(f"Extracting claims from chunks ({workers} parallel requests)...")
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(extract_chunk, chunks))
+    
+    def _extract_chunk_claims_batch(self, chunks: List[Dict]) -> List[List[ClaimObject]]:
+        """Submit all chunks as one Gemini Batch API job and block until it finishes."""
+        batch_name = self.llm_client.submit_claims_batch(
+            chunks,
+            available_citations=self.citations,
+            paper_title=self.paper_title,
+            paper_abstract=self.paper_abstract
+        )
+        print(f"Submitted {len(chunks)} chunks as batch job {batch_name}; waiting for results...")
+        results = dict(self.llm_client.poll_batch(batch_name))
+        return [results.get(chunk['chunk_id'], []) for chunk in chunks]
+    
     def map_citations_to_claims(self) -> List[ClaimObject]:
         """
         Map citation details to claims based on citation markers.
@@ -185,6 +310,9 @@ class HybridClaimExtractor:
         """
         print("Mapping citations to claims...")
         
+        # Many claims share a citation; parse each reference entry once and
+        # give every claim its own copy.
+        details_by_id: Dict[str, CitationDetails] = {}
         for claim in self.claims:
             if claim.citation_found and claim.citation_text:
                 # Extract citation ID from marker
@@ -195,9 +323,11 @@ class HybridClaimExtractor:
                     claim.citation_id = citation_id
                     
                     # Create CitationDetails object
-                    claim.citation_details = self._parse_citation_details(
-                        self.citations[citation_id]
-                    )
+                    if citation_id not in details_by_id:
+                        details_by_id[citation_id] = self._parse_citation_details(
+                            self.citations[citation_id]
+                        )
+                    claim.citation_details = details_by_id[citation_id].model_copy(deep=True)
         
         mapped_count = sum(1 for c in self.claims if c.citation_details is not None)
         print(f"✓ Mapped {mapped_count}/{len(self.claims)} citations")
@@ -264,28 +394,40 @@ class HybridClaimExtractor:
         print(f"Processing: {Path(pdf_path).name}")
         print(f"{'='*60}\n")
         
-        # Extract text
-        full_text = extract_text_from_pdf(pdf_path)
-        
-        # Extract title and abstract for context
-        print("Extracting title and abstract...")
-        paper_metadata = extract_title_and_abstract(full_text)
-        self.paper_title = paper_metadata['title']
-        self.paper_abstract = paper_metadata['abstract']
+        # Extract text and title/abstract for context
+        if ENABLE_PDF_CACHE:
+            # Hashing reads the whole PDF, so it is done once per paper
+            cache_path = pdf_cache_path(pdf_path)
+            paper_metadata = cached_extract(pdf_path, cache_path)
+            full_text = paper_metadata['text']
+        else:
+            full_text = extract_text_from_pdf(pdf_path)
+            print("Extracting title and abstract...")
+            paper_metadata = extract_title_and_abstract(full_text)
+        self.paper_title = paper_metadata.get('title')
+        self.paper_abstract = paper_metadata.get('abstract')
         
         if self.paper_title:
             print(f"✓ Title: {self.paper_title[:80]}...")
         if self.paper_abstract:
             print(f"✓ Abstract: {self.paper_abstract[:100]}...")
         
-        # Extract citations
-        self.extract_citations(pdf_path)
+        # Extract citations, reusing the text and reference section located
+        # here rather than re-parsing the PDF
+        print("Locating reference section...")
+        ref_section = locate_reference_section(full_text)
+        if ENABLE_PDF_CACHE and paper_metadata.get('citations'):
+            self.citations = paper_metadata['citations']
+            print(f"✓ Loaded {len(self.citations)} cached citations")
+        else:
+            self.extract_citations_from_text(full_text, ref_section)
+            if ENABLE_PDF_CACHE and self.citations:
+                save_pdf_cache(pdf_path, cache_path, paper_metadata, citations=self.citations)
         
         # Remove reference section from text before claim extraction
-        ref_section = locate_reference_section(full_text)
         if ref_section:
             # Extract only the body text (before references)
-            body_text = full_text[:full_text.find(ref_section)]
+            body_text = full_text[:full_text.rfind(ref_section)]
         else:
             # Use first 70% if we can't find reference section
             body_text = full_text[:int(len(full_text) * 0.7)]
@@ -305,6 +447,7 @@ class HybridClaimExtractor:
         cost_info = self.llm_client.get_cost_summary()
         print(f"  Input tokens:  {cost_info['input_tokens']:,}")
         print(f"  Output tokens: {cost_info['output_tokens']:,}")
+        print(f"  Cached input:  {cost_info.get('cached_input_tokens', 0):,}")
         print(f"  Total cost:    ${cost_info['total_cost']:.4f}")
         print(f"{'='*60}\n")
         
@@ -373,32 +516,38 @@ class HybridClaimExtractor:
         output_data = {
             "claims": [claim.model_dump() for claim in self.claims],
             "citations": self.citations,
-            "summary": {
-                "total_claims": len(self.claims),
-                "quantitative_claims": sum(1 for c in self.claims if c.claim_type == "quantitative"),
-                "qualitative_claims": sum(1 for c in self.claims if c.claim_type == "qualitative"),
-                "claims_with_citations": sum(1 for c in self.claims if c.citation_found),
-            }
+            "summary": _summarize_claims(self.claims)
         }
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        payload = None
+        if orjson is not None:
+            try:
+                payload = orjson.dumps(output_data, option=orjson.OPT_INDENT_2)
+            except orjson.JSONEncodeError:
+                # Values orjson rejects (e.g. numpy integers, >64-bit ints) go through json
+                payload = None
+
+        if payload is not None:
+            with open(output_path, 'wb') as f:
+                f.write(payload)
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(output_data, f, indent=2, ensure_ascii=False)
 
         print(f"✓ Results saved to {output_path}")
         return output_path
     
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _extract_citation_id(citation_marker: str) -> str:
         """Extract citation ID from marker like [1] or (Smith, 2020)"""
-        import re
-        
         # Numeric citation: [1] -> "1"
-        numeric_match = re.search(r'\[(\d+)\]', citation_marker)
+        numeric_match = _NUMERIC_MARKER_RE.search(citation_marker)
         if numeric_match:
             return numeric_match.group(1)
         
         # Author-year: (Smith, 2020) -> "Smith"
-        author_match = re.search(r'\(([A-Z][a-z]+)', citation_marker)
+        author_match = _AUTHOR_MARKER_RE.search(citation_marker)
         if author_match:
             return author_match.group(1)
         
@@ -407,8 +556,6 @@ class HybridClaimExtractor:
     @staticmethod
     def _parse_citation_details(citation_text: str) -> CitationDetails:
         """Parse citation text into structured details"""
-        import re
-        
         # Try to extract common fields
         title = None
         authors = []
@@ -417,17 +564,17 @@ class HybridClaimExtractor:
         doi = None
         
         # Extract year
-        year_match = re.search(r'\((\d{4})\)|(\d{4})', citation_text)
+        year_match = _YEAR_RE.search(citation_text)
         if year_match:
             year = int(year_match.group(1) or year_match.group(2))
         
         # Extract DOI
-        doi_match = re.search(r'doi[:\s]*(10\.\S+)', citation_text, re.IGNORECASE)
+        doi_match = _DOI_RE.search(citation_text)
         if doi_match:
             doi = doi_match.group(1).rstrip('.')
         
         # Extract URL
-        url_match = re.search(r'https?://\S+', citation_text)
+        url_match = _URL_RE.search(citation_text)
         if url_match:
             url = url_match.group(0).rstrip('.,;')
         
@@ -435,7 +582,7 @@ class HybridClaimExtractor:
         if year_match:
             author_part = citation_text[:year_match.start()].strip()
             # Split by common delimiters
-            author_part = re.split(r'[,;&]', author_part)[0]
+            author_part = _AUTHOR_DELIMITER_RE.split(author_part)[0]
             if author_part:
                 authors = [author_part.strip().rstrip('.')]
         
@@ -449,12 +596,46 @@ class HybridClaimExtractor:
         )
 
 
+def _process_pdf_file(pdf_path: str, rate_limit_share: float = 1.0) -> str:
+    """
+    Run the full extraction pipeline on one PDF and save its claims JSON.
+
+    Module-level (and self-contained) so it can be shipped to worker processes;
+    each worker builds its own extractor and Gemini client, limited to
+    ``rate_limit_share`` of the request budget. Returns the output path.
+    """
+    extractor = HybridClaimExtractor(rate_limit_share=rate_limit_share)
+    extractor.process_pdf(pdf_path)
+    return extractor.save_results(pdf_path=pdf_path)
+
+
+def process_pdf_directory(pdf_dir: str, max_workers: Optional[int] = None) -> List[str]:
+    """
+    Process every PDF in ``pdf_dir`` in parallel, one process per paper.
+
+    Results are written to ``CLAIM_EXTRACTION_OUTPUT_DIR/{pdf_stem}_claims.json``.
+    Returns the output paths in sorted PDF order.
+    """
+    pdf_paths = sorted(str(p) for p in Path(pdf_dir).glob("*.pdf"))
+    if not pdf_paths:
+        print(f"No PDF files found in {pdf_dir}")
+        return []
+
+    workers = min(max_workers or os.cpu_count() or 1, len(pdf_paths))
+    print(f"Processing {len(pdf_paths)} PDFs with {workers} worker processes...")
+    # Workers run concurrently against one Gemini quota, so each gets an
+    # equal share of the RPM/TPM budget.
+    process_pdf = partial(_process_pdf_file, rate_limit_share=1 / workers)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(process_pdf, pdf_paths))
+
+
 def main():
     """Example usage"""
     if len(sys.argv) < 2:
         print(
             "Usage: python -m hybrid_citation_scraper.claim_extractor "
-            "<pdf_path> [run_dir]"
+            "<pdf_path|pdf_dir> [run_dir]"
         )
         sys.exit(1)
 
@@ -465,6 +646,15 @@ def main():
         print(f"Error: File not found: {pdf_path}")
         sys.exit(1)
 
+    if Path(pdf_path).is_dir():
+        # A run dir belongs to a single PDF, so directory mode always writes
+        # to the legacy CLAIM_EXTRACTION_OUTPUT_DIR.
+        if run_dir:
+            print("Warning: run_dir is ignored when processing a directory")
+        output_paths = process_pdf_directory(pdf_path)
+        print(f"\n✓ Saved claims for {len(output_paths)} PDFs")
+        return
+
     run_paths = RunPaths.from_existing(run_dir) if run_dir else None
 
     # Create extractor
@@ -478,11 +668,12 @@ def main():
     output_path = extractor.save_results(pdf_path=pdf_path, run_paths=run_paths)
     
     # Print summary
+    summary = _summarize_claims(claims)
     print(f"\nSummary:")
-    print(f"  Total claims: {len(claims)}")
-    print(f"  Quantitative: {sum(1 for c in claims if c.claim_type == 'quantitative')}")
-    print(f"  Qualitative: {sum(1 for c in claims if c.claim_type == 'qualitative')}")
-    print(f"  With citations: {sum(1 for c in claims if c.citation_found)}")
+    print(f"  Total claims: {summary['total_claims']}")
+    print(f"  Quantitative: {summary['quantitative_claims']}")
+    print(f"  Qualitative: {summary['qualitative_claims']}")
+    print(f"  With citations: {summary['claims_with_citations']}")
 
 
 if __name__ == "__main__":
@@ -26,5 +26,32 @@ REFERENCE_KEYWORDS = [
 CHUNK_SIZE = 800  # tokens per chunk
 CHUNK_OVERLAP = 100  # overlap between chunks
 
+# Parallel LLM requests per paper during claim extraction (network-bound)
+CLAIM_EXTRACTION_MAX_WORKERS = 8
+
+# Skip the LLM call for chunks with no citation marker, number, or claim verb.
+# Saves requests on heading/caption-heavy papers but can miss plain uncited
+# qualitative claims ("X is Y"), so it is off by default.
+SKIP_NON_CANDIDATE_CHUNKS = False
+
+# Route claim extraction through the Gemini Batch API (half price, no realtime
+# rate limits, but results can take hours) for papers with at least this many
+# chunks. Off by default; enable for offline corpus runs.
+USE_BATCH_API_FOR_CLAIMS = False
+BATCH_API_MIN_CHUNKS = 5
+
 # Output directory for extracted claims (relative to project root)
 CLAIM_EXTRACTION_OUTPUT_DIR = "./hybrid_citation_scraper/test_outputs"
+
+# Claim extraction response cache (exact SHA-256 match, then embedding similarity).
+# Off by default; enable for corpus runs where papers share boilerplate text.
+ENABLE_CLAIM_CACHE = False
+CLAIM_CACHE_DIR = "./hybrid_citation_scraper/.claim_cache"
+CLAIM_CACHE_SIMILARITY_THRESHOLD = 0.97
+CLAIM_CACHE_EMBEDDING_MODEL = "gemini-embedding-001"
+
+# Per-PDF cache of extracted text, title/abstract and parsed citations, keyed by
+# the SHA-1 of the file contents. Off by default; enable when re-running the
+# pipeline on the same papers (e.g. while iterating on claim prompts).
+ENABLE_PDF_CACHE = False
+PDF_CACHE_DIR = "~/.cache/hybrid_scraper"
@@ -1,11 +1,30 @@
 """LLM client for Gemini model interactions"""
 
+import asyncio
+import hashlib
 import json
 import random
+import tempfile
+import threading
 import time
-from typing import List, Dict, Any, Optional
+from pathlib import Path
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 import google.genai as genai
 import google.genai.types as types
+import httpx
+from pydantic import TypeAdapter
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+try:
+    # orjson parses LLM responses 2-3x faster; json is the fallback
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 from llm_config import (
     GEMINI_API_KEY,
@@ -14,7 +33,14 @@ from llm_config import (
     ENABLE_COST_TRACKING,
     LLM_TASK_CONFIG,
 )
-from models import ClaimObject, LocationInText
+from models import ClaimObject, ExtractedClaimSchema, LocationInText
+from .claim_cache import ClaimCache
+from .config import (
+    ENABLE_CLAIM_CACHE,
+    CLAIM_CACHE_DIR,
+    CLAIM_CACHE_SIMILARITY_THRESHOLD,
+    CLAIM_CACHE_EMBEDDING_MODEL,
+)
 
 # Retry policy for transient Gemini errors (503 UNAVAILABLE, 429 RESOURCE_EXHAUSTED, etc.).
 # Backoff is exponential with jitter — delays are roughly 2s, 4s before the final attempt.
@@ -23,6 +49,36 @@ _LLM_BASE_BACKOFF_SECONDS = 2.0
 _LLM_RETRYABLE_HTTP_CODES = {"429", "500", "502", "503", "504"}
 _LLM_RETRYABLE_KEYWORDS = ("UNAVAILABLE", "RESOURCE_EXHAUSTED", "DEADLINE_EXCEEDED")
 
+# Upper bound on in-flight Gemini requests for the async batch path. Claim
+# extraction is network-bound, so chunks are dispatched concurrently up to this cap.
+_LLM_MAX_CONCURRENCY = 20
+
+# Default request/token budgets, enforced client-side by RateLimiter (threaded
+# path) and AsyncRateLimiter (async batch path) so bursts of chunks don't burn
+# the retry budget on 429s. Tune to the project's Gemini quota tier.
+_LLM_REQUESTS_PER_MINUTE = 1000
+_LLM_TOKENS_PER_MINUTE = 1_000_000
+# Rough per-request output allowance added to the prompt estimate, and the
+# chars-per-token ratio used to estimate prompt size without a tokenizer.
+_LLM_OUTPUT_TOKENS_ESTIMATE = 1000
+_CHARS_PER_TOKEN_ESTIMATE = 4
+
+# Transport timeouts for the async batch path. The connection pool is sized to
+# the batch's concurrency cap so every in-flight request reuses a kept-alive
+# connection instead of paying a fresh TCP/TLS handshake.
+_HTTP_TIMEOUT_SECONDS = 60.0
+_HTTP_CONNECT_TIMEOUT_SECONDS = 10.0
+
+# Gemini Batch API polling. Batch jobs are billed at half the realtime rate and
+# are not subject to per-minute rate limits, but may take up to 24h to finish.
+_BATCH_POLL_INTERVAL_SECONDS = 30.0
+_BATCH_TERMINAL_STATES = {
+    "JOB_STATE_SUCCEEDED",
+    "JOB_STATE_FAILED",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED",
+}
+
 
 def _is_transient_llm_error(exc: Exception) -> bool:
     """True if exc represents a transient Gemini failure worth retrying."""
@@ -35,14 +91,258 @@ def _is_transient_llm_error(exc: Exception) -> bool:
         return True
     return any(kw in msg for kw in _LLM_RETRYABLE_KEYWORDS)
 
+def _estimate_request_tokens(prompt: str, system_message: Optional[str]) -> int:
+    """Rough prompt + output token cost of one request, for the rate limiters."""
+    return (
+        (len(prompt) + len(system_message or "")) // _CHARS_PER_TOKEN_ESTIMATE
+        + _LLM_OUTPUT_TOKENS_ESTIMATE
+    )
+
+def _is_rate_limit_error(exc: Exception) -> bool:
+    """True if exc is a Gemini quota rejection (429 / RESOURCE_EXHAUSTED)."""
+    msg = str(exc)
+    return msg.startswith("429") or "RESOURCE_EXHAUSTED" in msg
+
+
+class _TokenBucket:
+    """
+    Token-bucket state over requests/min and tokens/min for Gemini calls.
+
+    Both buckets refill continuously at their per-minute rate. Limits adapt: a
+    429 halves them (down to ``min_fraction`` of the configured maximum), and
+    every ``recovery_after`` consecutive successes raise them 10% back toward
+    it. Subclasses add the blocking (``RateLimiter``) or awaitable
+    (``AsyncRateLimiter``) ``acquire``.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = _LLM_REQUESTS_PER_MINUTE,
+        tokens_per_minute: float = _LLM_TOKENS_PER_MINUTE,
+        min_fraction: float = 0.1,
+        recovery_after: int = 20,
+    ):
+        self.max_rpm = requests_per_minute
+        self.max_tpm = tokens_per_minute
+        self.rpm = requests_per_minute
+        self.tpm = tokens_per_minute
+        self.min_fraction = min_fraction
+        self.recovery_after = recovery_after
+        self._available_requests = float(requests_per_minute)
+        self._available_tokens = float(tokens_per_minute)
+        self._last_refill = time.monotonic()
+        self._successes = 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._available_requests = min(self.rpm, self._available_requests + elapsed * self.rpm / 60)
+        self._available_tokens = min(self.tpm, self._available_tokens + elapsed * self.tpm / 60)
+
+    def _try_acquire(self, tokens: int) -> float:
+        """Take capacity for one request and return 0, or return seconds to wait."""
+        self._refill()
+        # A single request larger than the whole bucket would never fit.
+        cost = min(tokens, self.tpm)
+        if self._available_requests >= 1 and self._available_tokens >= cost:
+            self._available_requests -= 1
+            self._available_tokens -= cost
+            return 0.0
+        wait = max(
+            (1 - self._available_requests) * 60 / self.rpm,
+            (cost - self._available_tokens) * 60 / self.tpm,
+        )
+        return max(wait, 0.01)
+
+    def on_rate_limited(self) -> None:
+        """Halve the limits after a 429."""
+        self._successes = 0
+        self.rpm = max(self.max_rpm * self.min_fraction, self.rpm / 2)
+        self.tpm = max(self.max_tpm * self.min_fraction, self.tpm / 2)
+        self._available_requests = min(self._available_requests, self.rpm)
+        self._available_tokens = min(self._available_tokens, self.tpm)
+
+    def on_success(self) -> None:
+        """Count a success; after a sustained run, raise limits toward the maximum."""
+        self._successes += 1
+        if self._successes >= self.recovery_after:
+            self._successes = 0
+            self.rpm = min(self.max_rpm, self.rpm * 1.1)
+            self.tpm = min(self.max_tpm, self.tpm * 1.1)
+
+
+class RateLimiter(_TokenBucket):
+    """
+    Thread-safe RPM/TPM limiter for the synchronous Gemini path.
+
+    One instance is shared by every thread calling ``LLMClient._chat_completion``,
+    so concurrent chunk extraction stays within the per-minute budgets.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int) -> None:
+        """Block until one request costing ``tokens`` fits in both budgets."""
+        while True:
+            with self._lock:
+                wait = self._try_acquire(tokens)
+            if not wait:
+                return
+            time.sleep(wait)
+
+    def on_rate_limited(self) -> None:
+        with self._lock:
+            super().on_rate_limited()
+
+    def on_success(self) -> None:
+        with self._lock:
+            super().on_success()
+
+
+class AsyncRateLimiter(_TokenBucket):
+    """
+    RPM/TPM limiter for async Gemini calls (see ``_TokenBucket``).
+    Must be created and used inside a single event loop.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until one request costing ``tokens`` fits in both budgets."""
+        # Waiters queue on the lock, so capacity is granted in FIFO order.
+        async with self._lock:
+            while True:
+                wait = self._try_acquire(tokens)
+                if not wait:
+                    return
+                await asyncio.sleep(wait)
+
+
+# Static claim-extraction instructions. Kept verbatim (no interpolation) and sent
+# as the system instruction so every chunk of every paper shares an identical
+# prompt prefix, which Gemini's implicit context caching bills at a discount.
+# Per-document context and the chunk text go in the user turn, after this prefix.
+_CLAIM_EXTRACTION_SYSTEM_MESSAGE = """You are a precise academic text analyzer that extracts claims and citations. Always return valid JSON.
+
+You are analyzing an academic text for claims. Extract ALL claims (both quantitative and qualitative) from the text you are given.
+
+IMPORTANT: Do NOT extract claims that are widely-known common knowledge or basic facts (e.g., "water boils at 100°C", "the Earth orbits the Sun", "DNA is a double helix"). Only extract claims that represent research findings, arguments, or assertions that would benefit from verification.
+
+For each claim, identify:
+1. The exact claim text
+2. Whether it's "quantitative" (involves numbers, statistics, measurements) or "qualitative" (descriptive, non-numerical)
+3. Any citation marker present (e.g., [1], (Smith, 2020), superscript numbers)
+4. Whether the claim is "original" - a direct conclusion or contribution from THIS paper (not citing external sources)
+
+Return a JSON array of claims with this exact structure:
+[
+{
+    "claim_text": "exact text of the claim",
+    "claim_type": "quantitative or qualitative",
+    "citation_marker": "[1] or null if no citation",
+    "is_original": true or false
+}
+]
+
+Guidelines:
+- A quantitative claim mentions specific numbers, percentages, rates, statistics, or measurements
+- Include the full sentence containing the claim
+- If no citation marker is visible, set citation_marker to null
+- Set is_original to true ONLY if: (a) no external citation is present AND (b) the claim is a conclusion/finding from THIS paper's own work, figures, tables, or experiments (considering the paper's title and abstract for context)
+- Set is_original to false if the claim cites external sources, even if discussing the paper's own work
+- ONLY extract objective, fact-based claims - do NOT include subjective opinions, interpretations, or qualitative judgments
+- SKIP claims that are common knowledge - do not include them in the output at all
+- SKIP claims that are subjective opinions (e.g., "This approach is promising", "The results are interesting")
+- Be thorough - extract all non-trivial, objective claims, not just the most prominent ones
+
+Return only the JSON array, no additional text."""
+
+# Constrained-decoding schema for claim extraction: a bare JSON array of claims
+# with an enum-typed claim_type.
+_CLAIM_RESPONSE_SCHEMA = list[ExtractedClaimSchema]  # builtin list: google-genai ignores typing.List
+
+# The per-chunk citation preview only has to show the model which marker style
+# the paper uses (mapping to full entries happens deterministically afterwards),
+# so a few short previews are enough. It is resent with every chunk.
+_CITATION_PREVIEW_LIMIT = 5
+_CITATION_PREVIEW_CHARS = 60
+
+# Cache entries are scoped to the exact instructions that produced them, so
+# editing the system message invalidates previously cached responses.
+_CLAIM_PROMPT_VERSION = hashlib.sha256(_CLAIM_EXTRACTION_SYSTEM_MESSAGE.encode("utf-8")).hexdigest()[:16]
+
+
+def _claims_occur_in(content: str, text: str) -> bool:
+    """
+    True if every claim in a raw claim-extraction response has its text and
+    citation marker in ``text``, ignoring whitespace differences.
+    """
+    try:
+        result = _json_loads(content)
+        claims_data = result.get("claims", result) if isinstance(result, dict) else result
+        normalized_text = " ".join(text.split())
+        return all(
+            " ".join((claim_data.get("claim_text") or "").split()) in normalized_text
+            and (
+                claim_data.get("citation_marker") is None
+                or " ".join(claim_data["citation_marker"].split()) in normalized_text
+            )
+            for claim_data in claims_data
+        )
+    except Exception:
+        return False
+
+
+def _citation_sort_key(citation_id: str) -> Tuple[int, int, str]:
+    """Order citation ids naturally: 1, 2, ..., 10 before author keys."""
+    if citation_id.isdigit():
+        return (0, int(citation_id), citation_id)
+    return (1, 0, citation_id)
+
+
 class LLMClient:
     """Client for interacting with Gemini API"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        claim_cache: Optional[ClaimCache] = None,
+        rate_limit_share: float = 1.0,
+    ):
+        """
+        ``rate_limit_share`` scales the default RPM/TPM budgets, for callers
+        that run several clients against one quota (e.g. one per process).
+        """
         self.client = genai.Client(api_key=GEMINI_API_KEY)
         self.model = DEFAULT_LLM_MODEL
         self.total_input_tokens = 0
         self.total_output_tokens = 0
+        self.total_cached_tokens = 0
+        # Chunks may be extracted from several threads at once
+        self._usage_lock = threading.Lock()
+        self.rate_limiter = RateLimiter(
+            _LLM_REQUESTS_PER_MINUTE * rate_limit_share,
+            _LLM_TOKENS_PER_MINUTE * rate_limit_share,
+        )
+        if claim_cache is None and ENABLE_CLAIM_CACHE:
+            claim_cache = ClaimCache(
+                CLAIM_CACHE_DIR,
+                embed_fn=self._embed_text,
+                similarity_threshold=CLAIM_CACHE_SIMILARITY_THRESHOLD,
+            )
+        self.claim_cache = claim_cache
+
+    def _embed_text(self, text: str) -> List[float]:
+        """Embed text with the claim-cache embedding model."""
+        response = self.client.models.embed_content(
+            model=CLAIM_CACHE_EMBEDDING_MODEL,
+            contents=text,
+        )
+        return response.embeddings[0].values
 
     def _get_task_config(self, task_name: str) -> Dict[str, Any]:
         """Return task config with safe fallback."""
@@ -50,16 +350,16 @@ class LLMClient:
             return LLM_TASK_CONFIG[task_name]
         return LLM_TASK_CONFIG["generic"]
 
-    def _chat_completion(
+    def _build_generation_config(
         self,
         *,
-        prompt: str,
         task_name: str,
-        response_format: str = "json",
-        system_message: Optional[str] = None,
-        temperature: Optional[float] = None,
+        response_format: str,
+        system_message: Optional[str],
+        temperature: Optional[float],
+        response_schema: Optional[Any] = None,
     ):
-        """Centralized Gemini chat completion call with per-task routing."""
+        """Resolve (model_name, GenerateContentConfig) for a task."""
         task_cfg = self._get_task_config(task_name)
         model_name = task_cfg.get("model", self.model)
         temp = task_cfg.get("temperature", DEFAULT_LLM_TEMPERATURE)
@@ -70,18 +370,57 @@ class LLMClient:
             temperature=temp,
             response_mime_type="application/json" if response_format == "json" else None,
             system_instruction=system_message,
+            response_schema=response_schema,
         )
+        return model_name, generation_config
+
+    def _record_usage(self, response) -> None:
+        """Accumulate token usage from a Gemini response."""
+        usage = getattr(response, "usage_metadata", None)
+        if ENABLE_COST_TRACKING and usage:
+            with self._usage_lock:
+                self.total_input_tokens += getattr(usage, "prompt_token_count", 0) or 0
+                self.total_output_tokens += getattr(usage, "candidates_token_count", 0) or 0
+                self.total_cached_tokens += getattr(usage, "cached_content_token_count", 0) or 0
+
+    def _chat_completion(
+        self,
+        *,
+        prompt: str,
+        task_name: str,
+        response_format: str = "json",
+        system_message: Optional[str] = None,
+        temperature: Optional[float] = None,
+        response_schema: Optional[Any] = None,
+    ):
+        """
+        Centralized Gemini chat completion call with per-task routing.
+        Every attempt is throttled by the client's shared ``rate_limiter``.
+        """
+        model_name, generation_config = self._build_generation_config(
+            task_name=task_name,
+            response_format=response_format,
+            system_message=system_message,
+            temperature=temperature,
+            response_schema=response_schema,
+        )
+
+        estimated_tokens = _estimate_request_tokens(prompt, system_message)
 
         response = None
         for attempt in range(1, _LLM_MAX_ATTEMPTS + 1):
+            self.rate_limiter.acquire(estimated_tokens)
             try:
                 response = self.client.models.generate_content(
                     model=model_name,
                     contents=prompt,
                     config=generation_config,
                 )
+                self.rate_limiter.on_success()
                 break
             except Exception as exc:
+                if _is_rate_limit_error(exc):
+                    self.rate_limiter.on_rate_limited()
                 is_last_attempt = attempt == _LLM_MAX_ATTEMPTS
                 if is_last_attempt or not _is_transient_llm_error(exc):
                     raise
@@ -92,119 +431,412 @@ class LLMClient:
                 )
                 time.sleep(delay)
 
-        usage = getattr(response, "usage_metadata", None)
-        if ENABLE_COST_TRACKING and usage:
-            self.total_input_tokens += getattr(usage, "prompt_token_count", 0) or 0
-            self.total_output_tokens += getattr(usage, "candidates_token_count", 0) or 0
+        self._record_usage(response)
+        return response
+
+    async def _achat_completion(
+        self,
+        aclient,
+        *,
+        prompt: str,
+        task_name: str,
+        response_format: str = "json",
+        system_message: Optional[str] = None,
+        temperature: Optional[float] = None,
+        response_schema: Optional[Any] = None,
+        rate_limiter: Optional[AsyncRateLimiter] = None,
+    ):
+        """
+        Async counterpart of ``_chat_completion`` using ``genai.Client.aio``.
+
+        When ``rate_limiter`` is given, every attempt first acquires capacity for
+        the estimated request size, and 429s / successes are reported back to it.
+        """
+        model_name, generation_config = self._build_generation_config(
+            task_name=task_name,
+            response_format=response_format,
+            system_message=system_message,
+            temperature=temperature,
+            response_schema=response_schema,
+        )
+
+        estimated_tokens = _estimate_request_tokens(prompt, system_message)
+
+        response = None
+        for attempt in range(1, _LLM_MAX_ATTEMPTS + 1):
+            if rate_limiter is not None:
+                await rate_limiter.acquire(estimated_tokens)
+            try:
+                response = await aclient.models.generate_content(
+                    model=model_name,
+                    contents=prompt,
+                    config=generation_config,
+                )
+                if rate_limiter is not None:
+                    rate_limiter.on_success()
+                break
+            except Exception as exc:
+                if rate_limiter is not None and _is_rate_limit_error(exc):
+                    rate_limiter.on_rate_limited()
+                is_last_attempt = attempt == _LLM_MAX_ATTEMPTS
+                if is_last_attempt or not _is_transient_llm_error(exc):
+                    raise
+                delay = _LLM_BASE_BACKOFF_SECONDS * (2 ** (attempt - 1)) + random.uniform(0, 0.5)
+                print(
+                    f"  Transient LLM error (attempt {attempt}/{_LLM_MAX_ATTEMPTS}, "
+                    f"model={model_name}): {exc}. Retrying in {delay:.1f}s..."
+                )
+                await asyncio.sleep(delay)
 
+        self._record_usage(response)
         return response
 
-    def extract_claims_from_chunk(
+    def _build_claim_prompt(
         self,
         chunk_text: str,
-        chunk_id: int,
         available_citations: Optional[Dict[str, str]] = None,
         paper_title: Optional[str] = None,
         paper_abstract: Optional[str] = None
-    ) -> List[ClaimObject]:
-        """
-        Extract claims from a text chunk using Gemini.
-        Returns list of ClaimObject instances.
-        """
+    ) -> str:
+        """Build the claim-extraction prompt for a single chunk."""
         citation_context = ""
         if available_citations:
-            citation_list = "\n".join([f"{k}: {v[:100]}..." for k, v in list(available_citations.items())[:10]])
-            citation_context = f"\n\nAvailable citations in this document:\n{citation_list}"
+            # Sorted so the citation block is byte-identical for every chunk of a
+            # paper and stays inside the cacheable prompt prefix.
+            citation_ids = sorted(available_citations, key=_citation_sort_key)[:_CITATION_PREVIEW_LIMIT]
+            citation_list = "\n".join(
+                [f"{k}: {available_citations[k][:_CITATION_PREVIEW_CHARS]}..." for k in citation_ids]
+            )
+            citation_context = f"Available citations in this document:\n{citation_list}\n\n"
 
         paper_context = ""
         if paper_title or paper_abstract:
-            paper_context = "\n\nPaper Context:"
+            paper_context = "Paper Context:"
             if paper_title:
                 paper_context += f"\nTitle: {paper_title}"
             if paper_abstract:
                 abstract_preview = paper_abstract[:400] + "..." if len(paper_abstract) > 400 else paper_abstract
                 paper_context += f"\nAbstract: {abstract_preview}"
+            paper_context += "\n\n"
 
-        prompt = f"""You are analyzing an academic text for claims. Extract ALL claims (both quantitative and qualitative) from the text below.
+        # Stable per-paper context first, varying chunk text last.
+        prompt = f"{paper_context}{citation_context}Text to analyze:\n{chunk_text}"
+        return prompt
 
-            IMPORTANT: Do NOT extract claims that are widely-known common knowledge or basic facts (e.g., "water boils at 100°C", "the Earth orbits the Sun", "DNA is a double helix"). Only extract claims that represent research findings, arguments, or assertions that would benefit from verification.
+    def _parse_claims_response(self, content: Optional[str], chunk_id: int) -> List[ClaimObject]:
+        """Convert a claim-extraction JSON response into ClaimObject instances."""
+        if not content:
+            return []
 
-            For each claim, identify:
-            1. The exact claim text
-            2. Whether it's "quantitative" (involves numbers, statistics, measurements) or "qualitative" (descriptive, non-numerical)
-            3. Any citation marker present (e.g., [1], (Smith, 2020), superscript numbers)
-            4. Whether the claim is "original" - a direct conclusion or contribution from THIS paper (not citing external sources)
+        result = _json_loads(content)
+
+        # Handle both {"claims": [...]} and direct array formats
+        claims_data = result.get("claims", result) if isinstance(result, dict) else result
+
+        # Convert to ClaimObject instances
+        claims = []
+        for idx, claim_data in enumerate(claims_data):
+            claim_id = f"claim_{chunk_id}_{idx}"
+
+            claim = ClaimObject(
+                claim_id=claim_id,
+                text=claim_data.get("claim_text", ""),
+                claim_type=claim_data.get("claim_type", "qualitative"),
+                citation_found=claim_data.get("citation_marker") is not None,
+                citation_text=claim_data.get("citation_marker"),
+                citation_details=None,  # Will be populated later
+                is_original=claim_data.get("is_original", False),
+                # start/end are filled in by the extractor, which has the
+                # full document text to locate the claim against.
+                location_in_text=LocationInText(chunk_id=chunk_id)
+            )
+            claims.append(claim)
+
+        return claims
+
+    def _claim_cache_key(self, prompt: str) -> str:
+        """Cache key for a fully built claim-extraction prompt."""
+        model_name = self._get_task_config("claim_extraction").get("model", self.model)
+        # The prompt carries the paper context, citation preview and template
+        # layout, so a change to any of them misses the exact tier.
+        return ClaimCache.make_key(model_name, _CLAIM_PROMPT_VERSION, prompt)
+
+    def _lookup_cached_claims(
+        self, cache_key: str, chunk_text: str, chunk_id: int
+    ) -> Optional[List[ClaimObject]]:
+        """Claims for the chunk from the claim cache, or None on a miss."""
+        # A semantic hit was extracted from a different chunk (possibly another
+        # paper, or the same boilerplate with different numbers), so it is only
+        # reused when every cached claim occurs verbatim in this chunk.
+        cached_content, _ = self.claim_cache.lookup(
+            cache_key, chunk_text, accept=lambda content: _claims_occur_in(content, chunk_text)
+        )
+        if cached_content is None:
+            return None
+        try:
+            return self._parse_claims_response(cached_content, chunk_id)
+        except Exception as e:
+            print(f"Warning: ignoring unparseable claim cache entry for chunk {chunk_id}: {e}")
+            return None
 
-            Return a JSON array of claims with this exact structure:
-            [
-            {{
-                "claim_text": "exact text of the claim",
-                "claim_type": "quantitative or qualitative",
-                "citation_marker": "[1] or null if no citation",
-                "is_original": true or false
-            }}
-            ]
-
-            Guidelines:
-            - A quantitative claim mentions specific numbers, percentages, rates, statistics, or measurements
-            - Include the full sentence containing the claim
-            - If no citation marker is visible, set citation_marker to null
-            - Set is_original to true ONLY if: (a) no external citation is present AND (b) the claim is a conclusion/finding from THIS paper's own work, figures, tables, or experiments (considering the paper's title and abstract for context)
-            - Set is_original to false if the claim cites external sources, even if discussing the paper's own work
-            - ONLY extract objective, fact-based claims - do NOT include subjective opinions, interpretations, or qualitative judgments
-            - SKIP claims that are common knowledge - do not include them in the output at all
-            - SKIP claims that are subjective opinions (e.g., "This approach is promising", "The results are interesting")
-            - Be thorough - extract all non-trivial, objective claims, not just the most prominent ones
-            {paper_context}
-            {citation_context}
-
-            Text to analyze:
-            {chunk_text}
-
-            Return only the JSON array, no additional text."""
+    def extract_claims_from_chunk(
+        self,
+        chunk_text: str,
+        chunk_id: int,
+        available_citations: Optional[Dict[str, str]] = None,
+        paper_title: Optional[str] = None,
+        paper_abstract: Optional[str] = None
+    ) -> List[ClaimObject]:
+        """
+        Extract claims from a text chunk using Gemini.
+        Returns list of ClaimObject instances. When a claim cache is configured,
+        a cached response for the same prompt is re-parsed instead of calling
+        the API; a response for a near-identical chunk is reused only if all of
+        its claims occur in this chunk.
+        """
+        prompt = self._build_claim_prompt(chunk_text, available_citations, paper_title, paper_abstract)
 
         try:
+            cache_key = None
+            if self.claim_cache is not None:
+                cache_key = self._claim_cache_key(prompt)
+                cached_claims = self._lookup_cached_claims(cache_key, chunk_text, chunk_id)
+                if cached_claims is not None:
+                    return cached_claims
+
             response = self._chat_completion(
                 prompt=prompt,
                 task_name="claim_extraction",
                 response_format="json",
-                system_message="You are a precise academic text analyzer that extracts claims and citations. Always return valid JSON.",
+                system_message=_CLAIM_EXTRACTION_SYSTEM_MESSAGE,
+                response_schema=_CLAIM_RESPONSE_SCHEMA,
             )
+            claims = self._parse_claims_response(response.text, chunk_id)
+            if cache_key is not None and response.text:
+                self.claim_cache.put(cache_key, chunk_text, response.text)
+            return claims
 
-            content = response.text
-            if not content:
-                return []
-
-            result = json.loads(content)
-
-            # Handle both {"claims": [...]} and direct array formats
-            claims_data = result.get("claims", result) if isinstance(result, dict) else result
-
-            # Convert to ClaimObject instances
-            claims = []
-            for idx, claim_data in enumerate(claims_data):
-                claim_id = f"claim_{chunk_id}_{idx}"
-
-                claim = ClaimObject(
-                    claim_id=claim_id,
-                    text=claim_data.get("claim_text", ""),
-                    claim_type=claim_data.get("claim_type", "qualitative"),
-                    citation_found=claim_data.get("citation_marker") is not None,
-                    citation_text=claim_data.get("citation_marker"),
-                    citation_details=None,  # Will be populated later
-                    is_original=claim_data.get("is_original", False),
-                    # start/end are filled in by the extractor, which has the
-                    # full document text to locate the claim against.
-                    location_in_text=LocationInText(chunk_id=chunk_id)
-                )
-                claims.append(claim)
+        except Exception as e:
+            print(f"Error extracting claims from chunk {chunk_id}: {e}")
+            return []
 
+    async def extract_claims_from_chunk_async(
+        self,
+        aclient,
+        chunk_text: str,
+        chunk_id: int,
+        semaphore: asyncio.Semaphore,
+        available_citations: Optional[Dict[str, str]] = None,
+        paper_title: Optional[str] = None,
+        paper_abstract: Optional[str] = None,
+        rate_limiter: Optional[AsyncRateLimiter] = None,
+    ) -> List[ClaimObject]:
+        """
+        Async variant of ``extract_claims_from_chunk`` bounded by ``semaphore``
+        and, when given, throttled by ``rate_limiter``. Uses the claim cache the
+        same way; its blocking lookups and writes run in worker threads.
+        """
+        prompt = self._build_claim_prompt(chunk_text, available_citations, paper_title, paper_abstract)
+
+        try:
+            cache_key = None
+            if self.claim_cache is not None:
+                cache_key = self._claim_cache_key(prompt)
+                cached_claims = await asyncio.to_thread(
+                    self._lookup_cached_claims, cache_key, chunk_text, chunk_id
+                )
+                if cached_claims is not None:
+                    return cached_claims
+
+            async with semaphore:
+                response = await self._achat_completion(
+                    aclient,
+                    prompt=prompt,
+                    task_name="claim_extraction",
+                    response_format="json",
+                    system_message=_CLAIM_EXTRACTION_SYSTEM_MESSAGE,
+                    response_schema=_CLAIM_RESPONSE_SCHEMA,
+                    rate_limiter=rate_limiter,
+                )
+            claims = self._parse_claims_response(response.text, chunk_id)
+            if cache_key is not None and response.text:
+                await asyncio.to_thread(self.claim_cache.put, cache_key, chunk_text, response.text)
             return claims
 
         except Exception as e:
             print(f"Error extracting claims from chunk {chunk_id}: {e}")
             return []
 
+    async def extract_claims_batch(
+        self,
+        chunks: List[Dict[str, Any]],
+        available_citations: Optional[Dict[str, str]] = None,
+        paper_title: Optional[str] = None,
+        paper_abstract: Optional[str] = None,
+        max_concurrency: int = _LLM_MAX_CONCURRENCY,
+        rate_limiter: Optional[AsyncRateLimiter] = None,
+    ) -> List[List[ClaimObject]]:
+        """
+        Extract claims from many chunks concurrently.
+
+        Public entry point for callers that already run an event loop; the
+        pipeline's ``HybridClaimExtractor`` uses the threaded
+        ``extract_claims_from_chunk`` path instead, throttled by the client's
+        ``RateLimiter``. Both read and fill the same
+        claim cache, so a restarted batch only pays for chunks not yet cached.
+
+        ``chunks`` are the dicts produced by ``semantic_chunk_text``. Returns one
+        claim list per chunk, in the same order as ``chunks``. The async client
+        and its httpx connection pool (HTTP/2 when ``h2`` is installed) are
+        created inside the running event loop and closed before returning, so
+        the pool never outlives the loop that owns it. Requests are throttled by
+        ``rate_limiter`` (a fresh ``AsyncRateLimiter`` with default budgets if
+        none is passed).
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        if rate_limiter is None:
+            rate_limiter = AsyncRateLimiter()
+        http_client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency,
+            ),
+            timeout=httpx.Timeout(_HTTP_TIMEOUT_SECONDS, connect=_HTTP_CONNECT_TIMEOUT_SECONDS),
+        )
+        aclient = genai.Client(
+            api_key=GEMINI_API_KEY,
+            http_options=types.HttpOptions(httpx_async_client=http_client),
+        ).aio
+        try:
+            return await asyncio.gather(*[
+                self.extract_claims_from_chunk_async(
+                    aclient,
+                    chunk['text'],
+                    chunk['chunk_id'],
+                    semaphore,
+                    available_citations=available_citations,
+                    paper_title=paper_title,
+                    paper_abstract=paper_abstract,
+                    rate_limiter=rate_limiter,
+                )
+                for chunk in chunks
+            ])
+        finally:
+            await aclient.aclose()
+            # genai leaves caller-supplied httpx clients open
+            await http_client.aclose()
+
+    def submit_claims_batch(
+        self,
+        chunks: List[Dict[str, Any]],
+        available_citations: Optional[Dict[str, str]] = None,
+        paper_title: Optional[str] = None,
+        paper_abstract: Optional[str] = None,
+    ) -> str:
+        """
+        Submit claim extraction for ``chunks`` as one Gemini Batch API job.
+
+        Writes one JSONL request per chunk keyed ``claim_{chunk_id}``, uploads it,
+        and returns the batch job name to pass to ``poll_batch``. Intended for
+        offline corpus runs; interactive single-chunk calls should keep using
+        ``extract_claims_from_chunk``.
+        """
+        model_name, generation_config = self._build_generation_config(
+            task_name="claim_extraction",
+            response_format="json",
+            system_message=_CLAIM_EXTRACTION_SYSTEM_MESSAGE,
+            temperature=None,
+        )
+        request_config = {
+            "temperature": generation_config.temperature,
+            "response_mime_type": generation_config.response_mime_type,
+            "response_json_schema": TypeAdapter(_CLAIM_RESPONSE_SCHEMA).json_schema(),
+        }
+
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".jsonl", delete=False, encoding="utf-8"
+        ) as f:
+            for chunk in chunks:
+                prompt = self._build_claim_prompt(
+                    chunk['text'], available_citations, paper_title, paper_abstract
+                )
+                line = {
+                    "key": f"claim_{chunk['chunk_id']}",
+                    "request": {
+                        "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+                        "system_instruction": {"parts": [{"text": _CLAIM_EXTRACTION_SYSTEM_MESSAGE}]},
+                        "generation_config": request_config,
+                    },
+                }
+                f.write(json.dumps(line, ensure_ascii=False) + "\n")
+            jsonl_path = Path(f.name)
+
+        try:
+            uploaded = self.client.files.upload(
+                file=str(jsonl_path),
+                config=types.UploadFileConfig(display_name="claim-extraction-batch", mime_type="jsonl"),
+            )
+        finally:
+            jsonl_path.unlink(missing_ok=True)
+
+        batch_job = self.client.batches.create(
+            model=model_name,
+            src=uploaded.name,
+            config={"display_name": "claim-extraction-batch"},
+        )
+        print(f"Submitted claim extraction batch {batch_job.name} ({len(chunks)} chunks)")
+        return batch_job.name
+
+    def poll_batch(
+        self,
+        batch_name: str,
+        poll_interval: float = _BATCH_POLL_INTERVAL_SECONDS,
+    ) -> Iterator[Tuple[int, List[ClaimObject]]]:
+        """
+        Wait for a batch submitted by ``submit_claims_batch`` and yield
+        ``(chunk_id, claims)`` pairs parsed from its output file.
+
+        Raises RuntimeError if the job ends in any state other than succeeded.
+        """
+        while True:
+            batch_job = self.client.batches.get(name=batch_name)
+            state = getattr(batch_job.state, "name", str(batch_job.state))
+            if state in _BATCH_TERMINAL_STATES:
+                break
+            time.sleep(poll_interval)
+
+        if state != "JOB_STATE_SUCCEEDED":
+            raise RuntimeError(f"Batch {batch_name} finished with state {state}: {batch_job.error}")
+
+        output = self.client.files.download(file=batch_job.dest.file_name)
+        for raw_line in output.decode("utf-8").splitlines():
+            if not raw_line.strip():
+                continue
+            line = _json_loads(raw_line)
+            chunk_id = int(line["key"].rsplit("_", 1)[1])
+
+            response = line.get("response")
+            if not response:
+                print(f"Error extracting claims from chunk {chunk_id}: {line.get('error')}")
+                yield chunk_id, []
+                continue
+
+            usage = response.get("usageMetadata") or {}
+            if ENABLE_COST_TRACKING:
+                with self._usage_lock:
+                    self.total_input_tokens += usage.get("promptTokenCount", 0) or 0
+                    self.total_output_tokens += usage.get("candidatesTokenCount", 0) or 0
+                    self.total_cached_tokens += usage.get("cachedContentTokenCount", 0) or 0
+
+            try:
+                parts = response["candidates"][0]["content"]["parts"]
+                content = "".join(part.get("text", "") for part in parts)
+                yield chunk_id, self._parse_claims_response(content, chunk_id)
+            except Exception as e:
+                print(f"Error extracting claims from chunk {chunk_id}: {e}")
+                yield chunk_id, []
+
     def parse_references_with_llm(self, ref_section: str) -> Dict[str, str]:
         """
         Parse reference section using LLM when deterministic parsing fails.
@@ -237,7 +869,7 @@ class LLMClient:
             if not content:
                 return {}
 
-            result = json.loads(content)
+            result = _json_loads(content)
 
             # Handle wrapped format
             if "citations" in result:
@@ -278,7 +910,7 @@ class LLMClient:
             content = response.text
 
             if response_format == "json":
-                return json.loads(content or "{}")
+                return _json_loads(content or "{}")
             else:
                 return content or ""
 
@@ -292,17 +924,23 @@ class LLMClient:
     def get_cost_summary(self) -> Dict[str, float]:
         """
         Calculate total cost based on token usage.
-        gemini-2.0-flash pricing: $0.10/M input tokens, $0.40/M output tokens
+        gemini-2.0-flash pricing: $0.10/M input tokens, $0.025/M cached input
+        tokens, $0.40/M output tokens. Gemini's prompt token count includes the
+        cached tokens, so they are billed at the cached rate only.
         """
-        input_cost = (self.total_input_tokens / 1_000_000) * 0.10
+        uncached_input_tokens = max(self.total_input_tokens - self.total_cached_tokens, 0)
+        cached_input_cost = (self.total_cached_tokens / 1_000_000) * 0.025
+        input_cost = (uncached_input_tokens / 1_000_000) * 0.10 + cached_input_cost
         output_cost = (self.total_output_tokens / 1_000_000) * 0.40
         total_cost = input_cost + output_cost
 
         return {
             "input_tokens": self.total_input_tokens,
             "output_tokens": self.total_output_tokens,
+            "cached_input_tokens": self.total_cached_tokens,
             "total_tokens": self.total_input_tokens + self.total_output_tokens,
             "input_cost": input_cost,
+            "cached_input_cost": cached_input_cost,
             "output_cost": output_cost,
             "total_cost": total_cost
         }
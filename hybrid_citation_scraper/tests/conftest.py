@@ -168,6 +168,9 @@ def mock_pdf_loader(monkeypatch, sample_pdf_text):
             # Split sample text into pages
             pages = sample_pdf_text.split('\n\n')
             return [MockPage(page) for page in pages if page.strip()]
+        
+        def lazy_load(self):
+            yield from self.load()
     
     def mock_loader_import(*args, **kwargs):
         return MockPDFLoader
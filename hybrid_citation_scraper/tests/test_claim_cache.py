@@ -0,0 +1,198 @@
+"""Tests for hybrid_citation_scraper.claim_cache module"""
+
+import json
+import pytest
+from unittest.mock import Mock, patch
+
+from hybrid_citation_scraper.claim_cache import ClaimCache
+from hybrid_citation_scraper.llm_client import LLMClient
+
+
+def _fake_embed(text):
+    """Deterministic 3-d embedding: near-identical texts map to near-identical vectors"""
+    return [len(text), text.count("e"), 1.0]
+
+
+class TestClaimCache:
+    """Tests for the two-tier ClaimCache"""
+
+    def test_make_key_depends_on_all_parts(self):
+        """Changing model, prompt version, or text changes the key"""
+        base = ClaimCache.make_key("m", "v1", "text")
+        assert base == ClaimCache.make_key("m", "v1", "text")
+        assert base != ClaimCache.make_key("m2", "v1", "text")
+        assert base != ClaimCache.make_key("m", "v2", "text")
+        assert base != ClaimCache.make_key("m", "v1", "text2")
+
+    def test_exact_hit_without_embeddings(self, tmp_path):
+        """Exact layer works with no embedding function"""
+        cache = ClaimCache(str(tmp_path))
+        key = ClaimCache.make_key("m", "v1", "chunk")
+
+        assert cache.get(key, "chunk") is None
+        cache.put(key, "chunk", '[{"claim_text": "x"}]')
+
+        assert cache.get(key, "chunk") == '[{"claim_text": "x"}]'
+        assert cache.get_stats() == {"exact_hits": 1, "semantic_hits": 0, "misses": 1}
+
+    def test_semantic_hit_above_threshold(self, tmp_path):
+        """A different but similar chunk is served from the embedding index"""
+        cache = ClaimCache(str(tmp_path), embed_fn=_fake_embed, similarity_threshold=0.99)
+        cache.put(ClaimCache.make_key("m", "v1", "the ethics statement"), "the ethics statement", "[]")
+
+        similar = "the ethics statement."
+        assert cache.get(ClaimCache.make_key("m", "v1", similar), similar) == "[]"
+        assert cache.get_stats()["semantic_hits"] == 1
+
+    def test_index_persists_across_instances(self, tmp_path):
+        """Embeddings written by one instance are loaded by the next"""
+        cache = ClaimCache(str(tmp_path), embed_fn=_fake_embed)
+        cache.put(ClaimCache.make_key("m", "v1", "boilerplate"), "boilerplate", "[]")
+        cache.flush()
+
+        reopened = ClaimCache(str(tmp_path), embed_fn=_fake_embed)
+        assert reopened.get(ClaimCache.make_key("m", "v1", "boilerplatf"), "boilerplatf") == "[]"
+
+    def test_index_written_in_batches(self, tmp_path):
+        """Puts buffer embeddings until flush_every is reached"""
+        cache = ClaimCache(str(tmp_path), embed_fn=_fake_embed, flush_every=2)
+        cache.put(ClaimCache.make_key("m", "v1", "a"), "a", "[]")
+        assert not (tmp_path / "embeddings.npy").exists()
+        assert cache.lookup(ClaimCache.make_key("m", "v1", "a!"), "a") == ("[]", True)
+
+        cache.put(ClaimCache.make_key("m", "v1", "bee"), "bee", "[]")
+        reopened = ClaimCache(str(tmp_path))
+        assert len(reopened._embedding_keys) == 2
+
+    def test_flush_merges_index_from_other_instances(self, tmp_path):
+        """Two caches sharing a directory keep each other's embeddings"""
+        first = ClaimCache(str(tmp_path), embed_fn=_fake_embed)
+        second = ClaimCache(str(tmp_path), embed_fn=_fake_embed)
+        first.put("k1", "alpha", "[]")
+        second.put("k2", "beta", "[]")
+        first.flush()
+        second.flush()
+
+        assert ClaimCache(str(tmp_path))._embedding_keys == ["k1", "k2"]
+
+    def test_embedding_failure_falls_back_to_miss(self, tmp_path):
+        """Embedding errors disable the semantic layer instead of raising"""
+        cache = ClaimCache(str(tmp_path), embed_fn=Mock(side_effect=RuntimeError("boom")))
+        assert cache.get(ClaimCache.make_key("m", "v1", "t"), "t") is None
+
+
+class TestLLMClientClaimCache:
+    """Tests for claim cache integration in LLMClient"""
+
+    @patch('hybrid_citation_scraper.llm_client.genai')
+    def test_cache_hit_skips_api_and_reassigns_chunk_id(self, mock_genai, tmp_path, sample_claims_data):
+        """Second identical chunk is served from cache with its own chunk_id"""
+        mock_response = Mock()
+        mock_response.text = json.dumps(sample_claims_data[:1])
+        mock_response.usage_metadata = Mock(
+            prompt_token_count=10, candidates_token_count=5, cached_content_token_count=None
+        )
+        mock_models = mock_genai.Client.return_value.models
+        mock_models.generate_content.return_value = mock_response
+
+        client = LLMClient(claim_cache=ClaimCache(str(tmp_path)))
+        first = client.extract_claims_from_chunk("Shared paragraph", chunk_id=0)
+        second = client.extract_claims_from_chunk("Shared paragraph", chunk_id=7)
+
+        assert mock_models.generate_content.call_count == 1
+        assert first[0].text == second[0].text
+        assert second[0].claim_id == "claim_7_0"
+        assert second[0].location_in_text.chunk_id == 7
+
+    @patch('hybrid_citation_scraper.llm_client.genai')
+    def test_cache_key_includes_citations(self, mock_genai, tmp_path, sample_claims_data):
+        """A changed citation list misses the exact tier"""
+        mock_response = Mock()
+        mock_response.text = json.dumps(sample_claims_data[:1])
+        mock_response.usage_metadata = None
+        mock_models = mock_genai.Client.return_value.models
+        mock_models.generate_content.return_value = mock_response
+
+        client = LLMClient(claim_cache=ClaimCache(str(tmp_path)))
+        client.extract_claims_from_chunk("Shared paragraph", chunk_id=0, available_citations={"1": "A"})
+        client.extract_claims_from_chunk("Shared paragraph", chunk_id=1, available_citations={"1": "B"})
+
+        assert mock_models.generate_content.call_count == 2
+
+    @patch('hybrid_citation_scraper.llm_client.genai')
+    def test_semantic_hit_reused_when_all_claims_occur(self, mock_genai, tmp_path):
+        """A near-duplicate response is served when each claim is in the current chunk"""
+        mock_genai.Client.return_value.models.generate_content.side_effect = AssertionError("API called")
+        client = LLMClient(claim_cache=ClaimCache(str(tmp_path), embed_fn=lambda text: [1.0, 0.0]))
+        cached = json.dumps([
+            {"claim_text": "Rates rose 5%.", "claim_type": "quantitative", "citation_marker": "[1]"},
+        ])
+        client.claim_cache.put("other", "other chunk", cached)
+
+        claims = client.extract_claims_from_chunk("Since 2010,  Rates rose\n5%. [1]", chunk_id=3)
+
+        assert [c.text for c in claims] == ["Rates rose 5%."]
+        assert claims[0].claim_id == "claim_3_0"
+
+    @patch('hybrid_citation_scraper.llm_client.genai')
+    def test_semantic_hit_with_missing_claim_calls_api(self, mock_genai, tmp_path, sample_claims_data):
+        """Boilerplate with different numbers is a miss, not an empty claim list"""
+        mock_response = Mock()
+        mock_response.text = json.dumps(sample_claims_data[:1])
+        mock_response.usage_metadata = None
+        mock_models = mock_genai.Client.return_value.models
+        mock_models.generate_content.return_value = mock_response
+        client = LLMClient(claim_cache=ClaimCache(str(tmp_path), embed_fn=lambda text: [1.0, 0.0]))
+        cached = json.dumps([
+            {"claim_text": "Rates rose 5% in 2020.", "claim_type": "quantitative", "citation_marker": None},
+        ])
+        client.claim_cache.put("other", "Rates rose 5% in 2020.", cached)
+
+        claims = client.extract_claims_from_chunk("Rates rose 7% in 2021.", chunk_id=1)
+
+        assert mock_models.generate_content.call_count == 1
+        assert len(claims) == 1
+        assert client.claim_cache.get_stats()["misses"] == 1
+
+    @patch('hybrid_citation_scraper.llm_client.genai')
+    def test_truncated_entry_is_a_miss(self, mock_genai, tmp_path, sample_claims_data):
+        """A response file cut short mid-write falls through to the API"""
+        mock_response = Mock()
+        mock_response.text = json.dumps(sample_claims_data[:1])
+        mock_response.usage_metadata = None
+        mock_models = mock_genai.Client.return_value.models
+        mock_models.generate_content.return_value = mock_response
+        client = LLMClient(claim_cache=ClaimCache(str(tmp_path)))
+        key = client._claim_cache_key(client._build_claim_prompt("Chunk"))
+        (tmp_path / "responses" / f"{key}.json").write_text('{"content": "[{\\"cla')
+
+        claims = client.extract_claims_from_chunk("Chunk", chunk_id=0)
+
+        assert mock_models.generate_content.call_count == 1
+        assert len(claims) == 1
+
+    @patch('hybrid_citation_scraper.llm_client.genai')
+    def test_async_batch_reads_and_fills_cache(self, mock_genai, tmp_path, sample_claims_data):
+        """extract_claims_batch shares the cache with the threaded path"""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        mock_response = Mock()
+        mock_response.text = json.dumps(sample_claims_data[:1])
+        mock_response.usage_metadata = None
+        mock_genai.Client.return_value.models.generate_content.return_value = mock_response
+        mock_aclient = mock_genai.Client.return_value.aio
+        mock_aclient.models.generate_content = AsyncMock(return_value=mock_response)
+        mock_aclient.aclose = AsyncMock()
+
+        client = LLMClient(claim_cache=ClaimCache(str(tmp_path)))
+        client.extract_claims_from_chunk("Cached chunk", chunk_id=0)
+        chunks = [
+            {'chunk_id': 0, 'text': 'Cached chunk', 'start_pos': 0},
+            {'chunk_id': 1, 'text': 'New chunk', 'start_pos': 13},
+        ]
+        result = asyncio.run(client.extract_claims_batch(chunks))
+
+        assert [claims[0].claim_id for claims in result] == ["claim_0_0", "claim_1_0"]
+        assert mock_aclient.models.generate_content.await_count == 1
+        assert client.claim_cache.get_stats()["exact_hits"] == 1
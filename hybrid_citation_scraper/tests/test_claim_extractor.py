@@ -170,6 +170,84 @@ class TestExtractClaimsFromText:
         assert len(result) == 2
         assert mock_llm_instance.extract_claims_from_chunk.call_count == 2
     
+    @patch('hybrid_citation_scraper.claim_extractor.LLMClient')
+    @patch('hybrid_citation_scraper.claim_extractor.semantic_chunk_text')
+    def test_extract_claims_keeps_chunk_order_when_concurrent(
+        self, mock_chunk, mock_llm_client, sample_claim_objects
+    ):
+        """Test that claims come back in chunk order even if later chunks finish first"""
+        import time
+        mock_chunk.return_value = [
+            {'chunk_id': 0, 'text': 'Chunk 1', 'start_pos': 0, 'end_pos': 7, 'token_count': 2},
+            {'chunk_id': 1, 'text': 'Chunk 2', 'start_pos': 7, 'end_pos': 14, 'token_count': 2}
+        ]
+        
+        def slow_first_chunk(text, chunk_id, **kwargs):
+            if chunk_id == 0:
+                time.sleep(0.05)
+            return [sample_claim_objects[chunk_id]]
+        
+        mock_llm_instance = mock_llm_client.return_value
+        mock_llm_instance.extract_claims_from_chunk.side_effect = slow_first_chunk
+        
+        extractor = HybridClaimExtractor()
+        result = extractor.extract_claims_from_text("Sample text")
+        
+        assert [c.claim_id for c in result] == [
+            sample_claim_objects[0].claim_id, sample_claim_objects[1].claim_id
+        ]
+    
+    @patch('hybrid_citation_scraper.claim_extractor.SKIP_NON_CANDIDATE_CHUNKS', True)
+    @patch('hybrid_citation_scraper.claim_extractor.LLMClient')
+    @patch('hybrid_citation_scraper.claim_extractor.semantic_chunk_text')
+    def test_extract_claims_skips_non_candidate_chunks(
+        self, mock_chunk, mock_llm_client, sample_claim_objects
+    ):
+        """Test that chunks without markers, numbers or claim verbs are not sent to the LLM"""
+        mock_chunk.return_value = [
+            {'chunk_id': 0, 'text': 'Methods and Materials', 'start_pos': 0, 'end_pos': 21, 'token_count': 3},
+            {'chunk_id': 1, 'text': 'Accuracy rose to 95% [1].', 'start_pos': 22, 'end_pos': 47, 'token_count': 8}
+        ]
+        
+        mock_llm_instance = mock_llm_client.return_value
+        mock_llm_instance.extract_claims_from_chunk.return_value = [sample_claim_objects[0]]
+        
+        extractor = HybridClaimExtractor()
+        result = extractor.extract_claims_from_text("Sample text")
+        
+        mock_llm_instance.extract_claims_from_chunk.assert_called_once()
+        assert mock_llm_instance.extract_claims_from_chunk.call_args[0][1] == 1
+        assert len(result) == 1
+    
+    @patch('hybrid_citation_scraper.claim_extractor.BATCH_API_MIN_CHUNKS', 2)
+    @patch('hybrid_citation_scraper.claim_extractor.USE_BATCH_API_FOR_CLAIMS', True)
+    @patch('hybrid_citation_scraper.claim_extractor.LLMClient')
+    @patch('hybrid_citation_scraper.claim_extractor.semantic_chunk_text')
+    def test_extract_claims_uses_batch_api_above_threshold(
+        self, mock_chunk, mock_llm_client, sample_claim_objects
+    ):
+        """Test that enough chunks are sent as one batch job instead of per-chunk calls"""
+        mock_chunk.return_value = [
+            {'chunk_id': 0, 'text': 'Chunk 1', 'start_pos': 0, 'end_pos': 7, 'token_count': 2},
+            {'chunk_id': 1, 'text': 'Chunk 2', 'start_pos': 7, 'end_pos': 14, 'token_count': 2}
+        ]
+        
+        mock_llm_instance = mock_llm_client.return_value
+        mock_llm_instance.submit_claims_batch.return_value = "batches/123"
+        mock_llm_instance.poll_batch.return_value = iter([
+            (1, [sample_claim_objects[1]]),
+            (0, [sample_claim_objects[0]]),
+        ])
+        
+        extractor = HybridClaimExtractor()
+        result = extractor.extract_claims_from_text("Sample text")
+        
+        mock_llm_instance.poll_batch.assert_called_once_with("batches/123")
+        mock_llm_instance.extract_claims_from_chunk.assert_not_called()
+        assert [c.claim_id for c in result] == [
+            sample_claim_objects[0].claim_id, sample_claim_objects[1].claim_id
+        ]
+    
     @patch('hybrid_citation_scraper.claim_extractor.LLMClient')
     @patch('hybrid_citation_scraper.claim_extractor.semantic_chunk_text')
     def test_extract_claims_locates_claim_span(
@@ -325,6 +403,33 @@ class TestMapCitationsToClaims:
         
         assert result[0].citation_id == "1"
     
+    @patch('hybrid_citation_scraper.claim_extractor.LLMClient')
+    def test_map_citations_shared_citation_gets_separate_details(
+        self, mock_llm_client, sample_citations_dict
+    ):
+        """Test that claims citing the same source get equal but independent details"""
+        claims = [
+            ClaimObject(
+                claim_id=f"c{i}",
+                text=f"Claim {i} [1]",
+                claim_type="qualitative",
+                citation_found=True,
+                citation_text="[1]",
+                is_original=False,
+                location_in_text=LocationInText(chunk_id=0)
+            )
+            for i in range(2)
+        ]
+        
+        extractor = HybridClaimExtractor()
+        extractor.claims = claims
+        extractor.citations = sample_citations_dict
+        
+        result = extractor.map_citations_to_claims()
+        
+        assert result[0].citation_details == result[1].citation_details
+        assert result[0].citation_details is not result[1].citation_details
+    
     @patch('hybrid_citation_scraper.claim_extractor.LLMClient')
     def test_map_citations_skips_uncited(self, mock_llm_client):
         """Test that claims without citations are skipped"""
@@ -481,6 +586,23 @@ class TestSaveResults:
         assert 'citations' in data
         assert 'summary' in data
         assert data['summary']['total_claims'] == len(sample_claim_objects)
+        assert data['summary']['quantitative_claims'] == 2
+        assert data['summary']['qualitative_claims'] == 1
+        assert data['summary']['claims_with_citations'] == 2
+
+    @patch('hybrid_citation_scraper.claim_extractor.LLMClient')
+    def test_save_results_falls_back_to_json(self, mock_llm_client, tmp_path):
+        """Values orjson rejects are still written via json"""
+        output_path = tmp_path / "results.json"
+
+        extractor = HybridClaimExtractor()
+        extractor.claims = []
+        extractor.citations = {"1": 2 ** 70}
+
+        extractor.save_results(str(output_path))
+
+        with open(output_path, 'r') as f:
+            assert json.load(f)['citations'] == {"1": 2 ** 70}
 
 
 class TestExtractCitationId:
@@ -602,3 +724,34 @@ class TestProcessPDF:
         assert isinstance(citations, dict)
         assert extractor.paper_title == 'Test Paper'
         assert extractor.paper_abstract == 'Test abstract'
+        # The PDF is parsed and the reference section located only once
+        mock_extract_text.assert_called_once_with("test.pdf")
+        mock_locate.assert_called_once_with(sample_pdf_text)
+
+
+class TestProcessPDFDirectory:
+    """Tests for process_pdf_directory"""
+
+    @patch('hybrid_citation_scraper.claim_extractor.ProcessPoolExecutor')
+    @patch('hybrid_citation_scraper.claim_extractor._process_pdf_file')
+    def test_processes_each_pdf_in_sorted_order(self, mock_process, mock_executor, tmp_path):
+        """Every PDF in the directory is dispatched once, in sorted order"""
+        from concurrent.futures import ThreadPoolExecutor
+        from hybrid_citation_scraper.claim_extractor import process_pdf_directory
+
+        for name in ("b.pdf", "a.pdf", "notes.txt"):
+            (tmp_path / name).write_text("x")
+        mock_executor.side_effect = lambda max_workers: ThreadPoolExecutor(max_workers)
+        mock_process.side_effect = lambda p, rate_limit_share: f"{Path(p).stem}_claims.json"
+
+        result = process_pdf_directory(str(tmp_path), max_workers=4)
+
+        assert result == ["a_claims.json", "b_claims.json"]
+        mock_executor.assert_called_once_with(max_workers=2)
+        # The two workers split the Gemini request budget
+        assert {c.kwargs['rate_limit_share'] for c in mock_process.call_args_list} == {0.5}
+
+    def test_empty_directory_returns_empty_list(self, tmp_path):
+        """A directory with no PDFs does not start a pool"""
+        from hybrid_citation_scraper.claim_extractor import process_pdf_directory
+        assert process_pdf_directory(str(tmp_path)) == []
@@ -3,8 +3,8 @@
 import pytest
 import json
 from unittest.mock import Mock, patch, MagicMock
-from hybrid_citation_scraper.llm_client import LLMClient
-from models import ClaimObject, LocationInText
+from hybrid_citation_scraper.llm_client import LLMClient, AsyncRateLimiter, RateLimiter
+from models import ClaimObject, ExtractedClaimSchema, LocationInText
 
 
 class TestLLMClientInit:
@@ -471,3 +471,270 @@ class TestGetCostSummary:
         assert summary['input_tokens'] == 200
         assert summary['output_tokens'] == 100
         assert summary['total_tokens'] == 300
+
+
+class TestExtractClaimsBatch:
+    """Tests for the async extract_claims_batch coroutine"""
+
+    @patch('hybrid_citation_scraper.llm_client.genai')
+    def test_extract_claims_batch_preserves_chunk_order(self, mock_genai, sample_claims_data):
+        """Each chunk gets its own claim list, returned in input order"""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        mock_response = Mock()
+        mock_response.text = json.dumps({"claims": sample_claims_data[:1]})
+        mock_response.usage_metadata = Mock(
+            prompt_token_count=10, candidates_token_count=5, cached_content_token_count=None
+        )
+
+        mock_aclient = mock_genai.Client.return_value.aio
+        mock_aclient.models.generate_content = AsyncMock(return_value=mock_response)
+        mock_aclient.aclose = AsyncMock()
+
+        chunks = [
+            {'chunk_id': 0, 'text': 'Chunk 0', 'start_pos': 0},
+            {'chunk_id': 1, 'text': 'Chunk 1', 'start_pos': 8},
+        ]
+
+        client = LLMClient()
+        result = asyncio.run(client.extract_claims_batch(chunks))
+
+        assert len(result) == 2
+        assert result[0][0].claim_id == "claim_0_0"
+        assert result[1][0].claim_id == "claim_1_0"
+        assert mock_aclient.models.generate_content.await_count == 2
+        mock_aclient.aclose.assert_awaited_once()
+        assert client.total_input_tokens == 20
+
+    @patch('hybrid_citation_scraper.llm_client.genai')
+    def test_extract_claims_batch_uses_pooled_http_client(self, mock_genai):
+        """Async client gets a keep-alive httpx pool sized to the concurrency cap, closed afterwards"""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        mock_aclient = mock_genai.Client.return_value.aio
+        mock_aclient.aclose = AsyncMock()
+
+        client = LLMClient()
+        asyncio.run(client.extract_claims_batch([], max_concurrency=7))
+
+        http_options = mock_genai.Client.call_args.kwargs['http_options']
+        http_client = http_options.httpx_async_client
+        assert http_client._transport._pool._max_connections == 7
+        assert http_client.is_closed
+
+
+class TestClaimsBatchAPI:
+    """Tests for submit_claims_batch / poll_batch"""
+
+    @patch('hybrid_citation_scraper.llm_client.genai')
+    def test_submit_claims_batch_uploads_one_request_per_chunk(self, mock_genai):
+        """The uploaded JSONL has one keyed request per chunk"""
+        captured = {}
+
+        def fake_upload(file, config=None):
+            with open(file, encoding='utf-8') as f:
+                captured['lines'] = [json.loads(line) for line in f]
+            return Mock(name='uploaded')
+
+        mock_client = mock_genai.Client.return_value
+        mock_client.files.upload.side_effect = fake_upload
+        mock_client.batches.create.return_value = Mock()
+        mock_client.batches.create.return_value.name = "batches/123"
+
+        chunks = [
+            {'chunk_id': 0, 'text': 'Chunk 0'},
+            {'chunk_id': 3, 'text': 'Chunk 3'},
+        ]
+        client = LLMClient()
+        batch_name = client.submit_claims_batch(chunks)
+
+        assert batch_name == "batches/123"
+        assert [line['key'] for line in captured['lines']] == ["claim_0", "claim_3"]
+        assert 'Chunk 3' in captured['lines'][1]['request']['contents'][0]['parts'][0]['text']
+        schema = captured['lines'][0]['request']['generation_config']['response_json_schema']
+        assert schema['type'] == 'array'
+
+    @patch('hybrid_citation_scraper.llm_client.genai')
+    def test_poll_batch_yields_claims_by_chunk(self, mock_genai, sample_claims_data):
+        """Output lines are parsed into (chunk_id, claims) pairs"""
+        mock_client = mock_genai.Client.return_value
+        job = Mock()
+        job.state.name = "JOB_STATE_SUCCEEDED"
+        job.dest.file_name = "files/out"
+        mock_client.batches.get.return_value = job
+
+        ok_line = {
+            "key": "claim_2",
+            "response": {
+                "candidates": [{"content": {"parts": [{"text": json.dumps(sample_claims_data[:2])}]}}],
+                "usageMetadata": {"promptTokenCount": 7, "candidatesTokenCount": 3},
+            },
+        }
+        err_line = {"key": "claim_5", "error": {"message": "boom"}}
+        mock_client.files.download.return_value = (
+            json.dumps(ok_line) + "\n" + json.dumps(err_line) + "\n"
+        ).encode("utf-8")
+
+        client = LLMClient()
+        results = dict(client.poll_batch("batches/123", poll_interval=0))
+
+        assert [c.claim_id for c in results[2]] == ["claim_2_0", "claim_2_1"]
+        assert results[5] == []
+        assert client.total_input_tokens == 7
+
+    @patch('hybrid_citation_scraper.llm_client.genai')
+    def test_poll_batch_raises_on_failed_job(self, mock_genai):
+        """A failed batch job surfaces as RuntimeError"""
+        job = Mock()
+        job.state.name = "JOB_STATE_FAILED"
+        mock_genai.Client.return_value.batches.get.return_value = job
+
+        client = LLMClient()
+        with pytest.raises(RuntimeError):
+            list(client.poll_batch("batches/123", poll_interval=0))
+
+
+class TestClaimPromptCaching:
+    """Tests for the cache-friendly claim extraction prompt layout"""
+
+    @patch('hybrid_citation_scraper.llm_client.genai')
+    def test_instructions_in_system_message_and_chunk_last(self, mock_genai, sample_citations_dict):
+        """Static guidelines live in the system instruction; chunk text ends the prompt"""
+        mock_response = Mock()
+        mock_response.text = json.dumps([])
+        mock_response.usage_metadata = Mock(
+            prompt_token_count=100, candidates_token_count=5, cached_content_token_count=80
+        )
+        mock_models = mock_genai.Client.return_value.models
+        mock_models.generate_content.return_value = mock_response
+
+        client = LLMClient()
+        client.extract_claims_from_chunk(
+            "Chunk body text", chunk_id=0, available_citations=sample_citations_dict
+        )
+
+        kwargs = mock_models.generate_content.call_args.kwargs
+        assert kwargs['contents'].endswith("Chunk body text")
+        assert kwargs['config'].response_schema == list[ExtractedClaimSchema]
+        assert "Guidelines:" not in kwargs['contents']
+        assert client.get_cost_summary()['cached_input_tokens'] == 80
+
+    def test_cached_input_tokens_billed_at_cached_rate(self):
+        """Cached prompt tokens are priced at the discounted rate, not the full one"""
+        with patch('hybrid_citation_scraper.llm_client.genai'):
+            client = LLMClient()
+        client.total_input_tokens = 1_000_000
+        client.total_cached_tokens = 800_000
+        client.total_output_tokens = 0
+
+        summary = client.get_cost_summary()
+
+        # 200k uncached at $0.10/M + 800k cached at $0.025/M
+        assert summary['cached_input_cost'] == pytest.approx(0.02)
+        assert summary['input_cost'] == pytest.approx(0.04)
+        assert summary['total_cost'] == pytest.approx(0.04)
+
+    def test_citation_context_is_order_independent(self, sample_citations_dict):
+        """Citation context is identical regardless of dict insertion order"""
+        with patch('hybrid_citation_scraper.llm_client.genai'):
+            client = LLMClient()
+        reversed_citations = dict(reversed(list(sample_citations_dict.items())))
+        assert client._build_claim_prompt("x", sample_citations_dict) == \
+            client._build_claim_prompt("x", reversed_citations)
+
+    def test_citation_context_is_capped_and_truncated(self):
+        """Only the first few citations are previewed, each cut to a short prefix"""
+        with patch('hybrid_citation_scraper.llm_client.genai'):
+            client = LLMClient()
+        citations = {str(i): f"Author{i}, A. (2020). " + "x" * 200 for i in range(1, 21)}
+        prompt = client._build_claim_prompt("chunk", citations)
+        preview_lines = [line for line in prompt.split("\n") if line[:1].isdigit()]
+        assert [line.split(":")[0] for line in preview_lines] == ["1", "2", "3", "4", "5"]
+        assert all(len(line) <= len("5: ") + 60 + len("...") for line in preview_lines)
+
+
+class TestRateLimiter:
+    """Tests for the thread-safe limiter on the synchronous path"""
+
+    def test_acquire_sleeps_when_request_budget_exhausted(self):
+        """A thread that does not fit sleeps until the bucket refills"""
+        limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=10_000)
+        for _ in range(60):
+            limiter.acquire(10)
+        with patch('hybrid_citation_scraper.llm_client.time.sleep') as mock_sleep:
+            mock_sleep.side_effect = lambda seconds: setattr(
+                limiter, '_last_refill', limiter._last_refill - seconds
+            )
+            limiter.acquire(10)
+        # One request at 60 RPM refills in ~1s
+        assert sum(c.args[0] for c in mock_sleep.call_args_list) == pytest.approx(1, rel=0.05)
+
+    @patch('hybrid_citation_scraper.llm_client.genai')
+    def test_chat_completion_goes_through_limiter(self, mock_genai):
+        """Every sync request acquires capacity and reports its outcome"""
+        client = LLMClient(rate_limit_share=0.5)
+        assert client.rate_limiter.max_rpm == 500
+        client.rate_limiter = Mock(wraps=client.rate_limiter)
+        mock_genai.Client.return_value.models.generate_content.return_value = Mock(usage_metadata=None)
+
+        client._chat_completion(prompt="x" * 400, task_name="claim_extraction")
+
+        client.rate_limiter.acquire.assert_called_once_with(100 + 1000)
+        client.rate_limiter.on_success.assert_called_once()
+
+
+class TestAsyncRateLimiter:
+    """Tests for the adaptive RPM/TPM token bucket"""
+
+    def test_acquire_within_budget_deducts_capacity(self):
+        """Requests that fit are granted immediately and drain both buckets"""
+        import asyncio
+
+        async def run():
+            limiter = AsyncRateLimiter(requests_per_minute=60, tokens_per_minute=1000)
+            await limiter.acquire(300)
+            await limiter.acquire(300)
+            return limiter
+
+        limiter = asyncio.run(run())
+        assert limiter._available_requests == pytest.approx(58, abs=0.1)
+        assert limiter._available_tokens == pytest.approx(400, abs=5)
+
+    def test_acquire_waits_when_token_budget_exhausted(self):
+        """A request that does not fit sleeps until the bucket refills"""
+        import asyncio
+
+        async def run():
+            limiter = AsyncRateLimiter(requests_per_minute=60, tokens_per_minute=600)
+            await limiter.acquire(600)
+            with patch('hybrid_citation_scraper.llm_client.asyncio.sleep') as mock_sleep:
+                async def fake_sleep(seconds):
+                    limiter._last_refill -= seconds
+                mock_sleep.side_effect = fake_sleep
+                await limiter.acquire(100)
+                return mock_sleep.call_args_list
+
+        sleeps = asyncio.run(run())
+        # 100 tokens at 600 TPM refill in ~10s
+        assert sum(c.args[0] for c in sleeps) == pytest.approx(10, rel=0.05)
+
+    def test_rate_limit_halves_and_success_recovers(self):
+        """429s halve limits down to the floor; sustained success raises them again"""
+        import asyncio
+
+        async def run():
+            return AsyncRateLimiter(requests_per_minute=100, tokens_per_minute=1000, recovery_after=2)
+
+        limiter = asyncio.run(run())
+        limiter.on_rate_limited()
+        assert (limiter.rpm, limiter.tpm) == (50, 500)
+        for _ in range(10):
+            limiter.on_rate_limited()
+        assert (limiter.rpm, limiter.tpm) == (10, 100)
+
+        limiter.on_success()
+        assert limiter.rpm == 10
+        limiter.on_success()
+        assert limiter.rpm == pytest.approx(11)
@@ -27,6 +27,70 @@ class TestExtractTextFromPDF:
         """Test that text from all pages is combined"""
         result = extract_text_from_pdf(temp_pdf_file)
         assert '\n\n' in result  # Pages should be separated by double newline
+    
+    def test_page_ranges_cover_all_pages_in_order(self):
+        """Test that parallel page ranges are contiguous and balanced"""
+        from hybrid_citation_scraper.utils import _page_ranges
+        assert _page_ranges(10, 3) == [(0, 4), (4, 7), (7, 10)]
+        assert _page_ranges(2, 8) == [(0, 1), (1, 2)]
+
+
+class TestPDFCache:
+    """Tests for the hash-keyed PDF extraction cache"""
+    
+    def test_cached_extract_runs_extraction_once(self, monkeypatch, tmp_path):
+        """Test that a second call is served from disk without re-extracting"""
+        from hybrid_citation_scraper import utils
+        temp_pdf_file = tmp_path / 'paper.pdf'
+        temp_pdf_file.write_bytes(b'%PDF-1.4 cached')
+        calls = []
+        monkeypatch.setattr(utils, 'PDF_CACHE_DIR', str(tmp_path / 'cache'))
+        monkeypatch.setattr(
+            utils, 'extract_text_from_pdf',
+            lambda path: calls.append(path) or "A Paper About Caching\n\nBody text."
+        )
+        
+        first = utils.cached_extract(temp_pdf_file)
+        second = utils.cached_extract(temp_pdf_file)
+        
+        assert len(calls) == 1
+        assert second['text'] == first['text']
+        assert second['title'] == 'A Paper About Caching'
+    
+    def test_save_pdf_cache_merges_citations(self, monkeypatch, tmp_path):
+        """Test that citations stored later are returned with the cached text"""
+        from hybrid_citation_scraper import utils
+        temp_pdf_file = tmp_path / 'paper.pdf'
+        temp_pdf_file.write_bytes(b'%PDF-1.4 cached')
+        monkeypatch.setattr(utils, 'PDF_CACHE_DIR', str(tmp_path / 'cache'))
+        monkeypatch.setattr(utils, 'extract_text_from_pdf', lambda path: "Some text")
+        
+        utils.cached_extract(temp_pdf_file)
+        utils.save_pdf_cache(temp_pdf_file, citations={'1': 'Smith, J. (2020).'})
+        
+        entry = utils.load_pdf_cache(temp_pdf_file)
+        assert entry['text'] == "Some text"
+        assert entry['citations'] == {'1': 'Smith, J. (2020).'}
+    
+    def test_cache_path_hashed_once_when_passed_through(self, monkeypatch, tmp_path):
+        """Test that passing cache_path and entry avoids re-hashing the PDF"""
+        from hybrid_citation_scraper import utils
+        temp_pdf_file = tmp_path / 'paper.pdf'
+        temp_pdf_file.write_bytes(b'%PDF-1.4 cached')
+        monkeypatch.setattr(utils, 'PDF_CACHE_DIR', str(tmp_path / 'cache'))
+        monkeypatch.setattr(utils, 'extract_text_from_pdf', lambda path: "Some text")
+        hashes = []
+        real_cache_path = utils.pdf_cache_path
+        monkeypatch.setattr(
+            utils, 'pdf_cache_path', lambda path: hashes.append(path) or real_cache_path(path)
+        )
+        
+        cache_path = utils.pdf_cache_path(temp_pdf_file)
+        entry = utils.cached_extract(temp_pdf_file, cache_path)
+        utils.save_pdf_cache(temp_pdf_file, cache_path, entry, citations={'1': 'Smith'})
+        
+        assert len(hashes) == 1
+        assert utils.load_pdf_cache(temp_pdf_file, cache_path)['citations'] == {'1': 'Smith'}
 
 
 class TestExtractTitleAndAbstract:
@@ -92,6 +156,18 @@ class TestLocateReferenceSection:
         text = "A" * 1000 + "\nReferences section here\n1. Citation"
         result = locate_reference_section(text)
         assert result is not None
+    
+    def test_locate_references_skips_table_of_contents(self):
+        """Test that the last standalone header wins over an earlier TOC entry"""
+        text = "Contents\nIntroduction\nReferences\n\nBody text.\n\nReferences\n1. Real citation"
+        result = locate_reference_section(text)
+        assert result == "1. Real citation"
+    
+    def test_locate_references_fallback_matches_whole_words(self):
+        """Test that the fallback does not match keywords inside other words"""
+        text = "A" * 1000 + "\nUser preferences were recorded."
+        result = locate_reference_section(text)
+        assert result is None
 
 
 class TestDetectCitationStyle:
@@ -158,6 +234,12 @@ class TestParseCitationsDeterministic:
             assert not citation_text.endswith(' ')
             assert '  ' not in citation_text  # No double spaces
     
+    def test_parse_handles_crlf_line_endings(self):
+        """Test that Windows line endings split entries like plain newlines"""
+        text = "[1] Smith, J. Deep learning.\r\n[2] Doe, A. Neural nets.\r\n"
+        result = parse_citations_deterministic(text, 'bracket_numeric')
+        assert result == {'1': 'Smith, J. Deep learning.', '2': 'Doe, A. Neural nets.'}
+    
     def test_parse_unsupported_style(self):
         """Test parsing with unsupported citation style"""
         text = "Some references"
@@ -301,6 +383,27 @@ class TestSemanticChunkText:
         # Should handle gracefully
         assert isinstance(result, list)
 
+    def test_sentence_split_keeps_abbreviations(self):
+        """Test that abbreviations like 'et al.' and 'Fig.' do not end a sentence"""
+        from hybrid_citation_scraper.utils import _split_sentences
+        text = "Smith et al. found a 12% gain. See Fig. 2 for details! Is it real? Yes."
+        assert _split_sentences(text) == [
+            "Smith et al. found a 12% gain.",
+            "See Fig. 2 for details!",
+            "Is it real?",
+            "Yes.",
+        ]
+
+    def test_sentence_split_after_ambiguous_abbreviation(self):
+        """Test that 'etc.' or 'Inc.' ends a sentence unless a lowercase word follows"""
+        from hybrid_citation_scraper.utils import _split_sentences
+        text = "Costs rose (fuel, labor, etc.) sharply. Data came from Acme Inc. The rest etc. and more."
+        assert _split_sentences(text) == [
+            "Costs rose (fuel, labor, etc.) sharply.",
+            "Data came from Acme Inc.",
+            "The rest etc. and more.",
+        ]
+
 
 class TestExtractCitationMarkers:
     """Tests for extract_citation_markers function"""
@@ -351,3 +454,9 @@ class TestExtractCitationMarkers:
         assert '[1]' in result
         assert '[2]' in result
         assert '[3]' in result
+    
+    def test_extract_preserves_document_order(self):
+        """Test that markers are returned in first-occurrence order"""
+        text = "Later work (Smith, 2020) extends [2], which builds on [1] and [2]."
+        result = extract_citation_markers(text)
+        assert result == ['(Smith, 2020)', '[2]', '[1]']
@@ -1,20 +1,157 @@
 """Utility functions for PDF extraction and text processing"""
 
+import gzip
+import hashlib
+import json
+import multiprocessing
+import os
 import re
-from typing import List, Dict, Optional, Tuple, Any
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import List, Dict, Iterator, Optional, Tuple, Any
 from pathlib import Path
 import tiktoken
 from langchain_community.document_loaders import PyPDFLoader
 
-from .config import REFERENCE_KEYWORDS, CITATION_STYLES, CHUNK_SIZE, CHUNK_OVERLAP
+from .config import REFERENCE_KEYWORDS, CITATION_STYLES, CHUNK_SIZE, CHUNK_OVERLAP, PDF_CACHE_DIR
+
+# Patterns compiled once at import. CITATION_STYLES stays a dict of strings in
+# config; the compiled forms live here.
+_COMPILED_STYLES = {
+    style: re.compile(pattern, re.MULTILINE) for style, pattern in CITATION_STYLES.items()
+}
+# Reference entry heads, matched per line. A head may also be a bare number
+# ("12." or "[12]") whose entry text starts on a following line.
+_NUMERIC_HEAD_RE = re.compile(r'\d+\.?\s+[A-Z]')
+_NUMERIC_BARE_HEAD_RE = re.compile(r'\d+\.?\s*')
+_NUMERIC_ENTRY_RE = re.compile(r'^(\d+)\.?\s+(.+)', re.DOTALL)
+_BRACKET_HEAD_RE = re.compile(r'\[\d+\]\s')
+_BRACKET_BARE_HEAD_RE = re.compile(r'\[\d+\]')
+_BRACKET_ENTRY_RE = re.compile(r'^\[(\d+)\]\s+(.+)', re.DOTALL)
+_UPPERCASE_START_RE = re.compile(r'\s*[A-Z]')
+_BLANK_LINE_RE = re.compile(r'\s*')
+_APA_ENTRY_START_RE = re.compile(r'^\w+,\s+\w\.')
+_WHITESPACE_RE = re.compile(r'\s+')
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+# Words that end in a period without ending the sentence (compared lower-case,
+# trailing period stripped). Splitting after "et al." or "Fig." would cut a
+# claim away from its citation or figure reference.
+_NON_TERMINAL_ABBREVIATIONS = frozenset({
+    'al', 'approx', 'ca', 'cf', 'ch', 'dr', 'e.g', 'eq', 'eqs', 'fig', 'figs',
+    'i.e', 'mr', 'mrs', 'ms', 'pp', 'prof', 'ref', 'refs', 'sec', 'viz', 'vol',
+    'vs',
+})
+# Abbreviations that often end a sentence too ("... Acme Inc."); they only
+# suppress a split when the next word starts lower-case.
+_AMBIGUOUS_ABBREVIATIONS = frozenset({
+    'co', 'etc', 'inc', 'jr', 'ltd', 'sr', 'st', 'u.k', 'u.s',
+})
+_REFERENCE_KEYWORD_ALTERNATION = '|'.join(map(re.escape, REFERENCE_KEYWORDS))
+# Reference header on a line of its own
+_REFERENCE_HEADER_RE = re.compile(
+    rf'^(?:{_REFERENCE_KEYWORD_ALTERNATION})\s*$', re.MULTILINE | re.IGNORECASE
+)
+# Any whole-word occurrence of a reference keyword, for the tail-of-document
+# fallback (word boundaries keep "preferences" from matching "references")
+_REFERENCE_KEYWORD_RE = re.compile(rf'\b(?:{_REFERENCE_KEYWORD_ALTERNATION})\b', re.IGNORECASE)
+# Numeric [1] and author-year (Smith, 2020) / (Jones et al., 2019) markers in one pass
+_CITATION_MARKER_RE = re.compile(
+    r'(?P<num>\[\d+\])|(?P<author_year>\([A-Z][a-z]+(?:\s+et al\.)?,\s+\d{4}\))'
+)
+
+
+# PDFs with at least this many pages are split across worker processes for
+# PyMuPDF extraction; below it, process start-up costs more than it saves.
+_PARALLEL_PDF_MIN_PAGES = 32
+
+
+def _page_ranges(page_count: int, parts: int) -> List[Tuple[int, int]]:
+    """Split [0, page_count) into at most ``parts`` contiguous (start, stop) ranges."""
+    parts = max(1, min(parts, page_count))
+    step, extra = divmod(page_count, parts)
+    ranges = []
+    start = 0
+    for i in range(parts):
+        stop = start + step + (1 if i < extra else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def _extract_fitz_page_range(args: Tuple[str, int, int]) -> List[str]:
+    """Worker: open the PDF with PyMuPDF and return text for pages [start, stop)."""
+    import fitz  # PyMuPDF
+    pdf_path, start, stop = args
+    with fitz.open(pdf_path) as doc:
+        return [doc[i].get_text() for i in range(start, stop)]
+
+
+def _extract_fitz_pages(pdf_path: str) -> List[str]:
+    """
+    Per-page PyMuPDF text. MuPDF documents cannot be shared across threads, so
+    long PDFs are split into page ranges, each opened in its own process.
+    Inside a worker process (e.g. ``process_pdf_directory``, which already runs
+    one PDF per CPU) pages are extracted serially.
+    """
+    import fitz  # PyMuPDF
+    with fitz.open(pdf_path) as doc:
+        page_count = doc.page_count
+
+    workers = os.cpu_count() or 1
+    in_worker_process = multiprocessing.parent_process() is not None
+    if page_count < _PARALLEL_PDF_MIN_PAGES or workers < 2 or in_worker_process:
+        return _extract_fitz_page_range((pdf_path, 0, page_count))
+
+    ranges = [(pdf_path, start, stop) for start, stop in _page_ranges(page_count, workers)]
+    try:
+        with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+            return [text for part in executor.map(_extract_fitz_page_range, ranges) for text in part]
+    except Exception as e:
+        # e.g. process spawning unavailable in this environment
+        print(f"Warning: parallel PyMuPDF extraction failed for {pdf_path} ({e}); extracting serially")
+        return _extract_fitz_page_range((pdf_path, 0, page_count))
 
 
 def extract_text_from_pdf(pdf_path: str) -> str:
-    """Extract text from PDF file using LangChain's PyPDFLoader"""
+    """
+    Extract text from PDF file.
+
+    Uses PyMuPDF (fitz) when installed — several times faster than pypdf on
+    long papers, and long PDFs are split across processes — and falls back to
+    LangChain's PyPDFLoader if fitz is missing, fails, or yields no text.
+    """
+    try:
+        text = '\n\n'.join(_extract_fitz_pages(pdf_path))
+        if text.strip():
+            return text
+        print(f"Warning: PyMuPDF found no text in {pdf_path}; falling back to pypdf")
+    except ImportError:
+        pass
+    except Exception as e:
+        print(f"Warning: PyMuPDF failed on {pdf_path} ({e}); falling back to pypdf")
+
     loader = PyPDFLoader(pdf_path)
-    pages = loader.load()
-    # Combine all pages into single text
-    return '\n\n'.join([page.page_content for page in pages])
+    # Combine all pages into single text, pulling one page at a time so the
+    # full Document list is never materialized
+    return '\n\n'.join(page.page_content for page in loader.lazy_load())
+
+
+def _iter_lines(text: str) -> Iterator[str]:
+    """Lazily yield the lines of text (as str.split('\n') would)."""
+    start = 0
+    while True:
+        end = text.find('\n', start)
+        if end == -1:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
+
+
+def _head_lines(text: str, count: int) -> List[str]:
+    """First ``count`` lines of text, without splitting the rest of the document."""
+    return list(islice(_iter_lines(text), count))
 
 
 def extract_title_and_abstract(full_text: str) -> Dict[str, Optional[str]]:
@@ -22,7 +159,9 @@ def extract_title_and_abstract(full_text: str) -> Dict[str, Optional[str]]:
     Extract title and abstract from PDF text.
     Returns dict with 'title' and 'abstract' keys.
     """
-    lines = full_text.split('\n')
+    # Title is searched in the first 10 lines and the abstract header in the
+    # first 50, with up to 30 lines of abstract after it.
+    lines = _head_lines(full_text, 80)
     title = None
     abstract = None
     
@@ -60,30 +199,106 @@ def extract_title_and_abstract(full_text: str) -> Dict[str, Optional[str]]:
     }
 
 
+# Bump when the cached fields or the extraction/parsing logic change so stale
+# entries are recomputed instead of reused.
+_PDF_CACHE_VERSION = 1
+
+
+def pdf_cache_path(pdf_path: str) -> Path:
+    """
+    Cache file for a PDF, keyed by the SHA-1 of its contents. Hashing reads the
+    whole file, so callers touching the cache several times should compute
+    this once and pass it as ``cache_path``.
+    """
+    sha1 = hashlib.sha1()
+    with open(pdf_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            sha1.update(block)
+    return Path(PDF_CACHE_DIR).expanduser() / f"{sha1.hexdigest()}.json.gz"
+
+
+def load_pdf_cache(pdf_path: str, cache_path: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    Return the cached entry for a PDF, or an empty dict on a miss.
+    Entries may hold 'text', 'title', 'abstract' and 'citations'.
+    """
+    path = cache_path or pdf_cache_path(pdf_path)
+    if not path.exists():
+        return {}
+    try:
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            entry = json.load(f)
+    except Exception as e:
+        print(f"Warning: could not read PDF cache {path}: {e}")
+        return {}
+    if entry.get('version') != _PDF_CACHE_VERSION:
+        return {}
+    return entry
+
+
+def save_pdf_cache(
+    pdf_path: str,
+    cache_path: Optional[Path] = None,
+    entry: Optional[Dict[str, Any]] = None,
+    **fields: Any,
+) -> None:
+    """
+    Merge ``fields`` into the cached entry for a PDF. When the caller already
+    holds the entry (e.g. from ``cached_extract``), pass it as ``entry`` to
+    skip re-reading the cache file; it is updated in place.
+    """
+    path = cache_path or pdf_cache_path(pdf_path)
+    if entry is None:
+        entry = load_pdf_cache(pdf_path, path)
+    entry.update(fields, version=_PDF_CACHE_VERSION)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"Warning: could not write PDF cache {path}: {e}")
+
+
+def cached_extract(pdf_path: str, cache_path: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    Extract text, title and abstract from a PDF, reusing the on-disk cache.
+    Returns the full cache entry, which also carries 'citations' if they
+    were stored by an earlier run.
+    """
+    path = cache_path or pdf_cache_path(pdf_path)
+    entry = load_pdf_cache(pdf_path, path)
+    if 'text' in entry:
+        return entry
+
+    text = extract_text_from_pdf(pdf_path)
+    metadata = extract_title_and_abstract(text)
+    save_pdf_cache(pdf_path, path, entry, text=text, **metadata)
+    return entry
+
+
 def locate_reference_section(full_text: str) -> Optional[str]:
     """
     Deterministically locate the reference section in text.
     Returns the reference section text or None if not found.
     """
-    # Try each reference keyword
-    for keyword in REFERENCE_KEYWORDS:
-        # Case-insensitive search for keyword at start of line
-        pattern = rf'^{keyword}\s*$'
-        match = re.search(pattern, full_text, re.MULTILINE | re.IGNORECASE)
-        
-        if match:
-            start_pos = match.end()
-            # Take everything after the keyword
-            # In practice, might want to detect end of references section too
-            ref_section = full_text[start_pos:].strip()
-            return ref_section
+    # Case-insensitive search for any keyword alone on a line. The reference
+    # list sits at the end of a paper, so take the last header; an earlier one
+    # is usually a table-of-contents entry.
+    match = None
+    for match in _REFERENCE_HEADER_RE.finditer(full_text):
+        pass
+    if match:
+        # Take everything after the keyword
+        # In practice, might want to detect end of references section too
+        return full_text[match.end():].strip()
     
-    # Fallback: look for common patterns in last 30% of document
-    last_third = full_text[int(len(full_text) * 0.7):]
-    for keyword in REFERENCE_KEYWORDS:
-        if keyword.lower() in last_third.lower():
-            idx = last_third.lower().index(keyword.lower())
-            return last_third[idx:]
+    # Fallback: look for common patterns in last 30% of document. Searching
+    # from a start offset avoids copying the tail before scanning it.
+    match = _REFERENCE_KEYWORD_RE.search(full_text, int(len(full_text) * 0.7))
+    if match:
+        return full_text[match.start():]
     
     return None
 
@@ -98,74 +313,99 @@ def detect_citation_style(ref_section: str) -> Optional[str]:
 
     # Skip blank lines; check up to 20 non-blank lines so PDF extraction
     # artifacts (blank lines, page headers) don't hide the first real entry.
-    non_blank_lines = [l for l in ref_section.split('\n') if l.strip()][:20]
+    non_blank_lines = list(islice((l for l in _iter_lines(ref_section) if l.strip()), 20))
     check_text = '\n'.join(non_blank_lines)
 
-    for style, pattern in CITATION_STYLES.items():
-        if re.search(pattern, check_text, re.MULTILINE):
+    for style, pattern in _COMPILED_STYLES.items():
+        if pattern.search(check_text):
             return style
 
     return None
 
 
+def _is_numeric_head(lines: List[str], i: int) -> bool:
+    """True if lines[i] starts a "N." / "N" entry followed by an uppercase letter."""
+    line = lines[i]
+    if _NUMERIC_HEAD_RE.match(line):
+        return True
+    if not _NUMERIC_BARE_HEAD_RE.fullmatch(line):
+        return False
+    # Bare number: the entry text must begin on the next non-blank line.
+    for j in range(i + 1, len(lines)):
+        next_line = lines[j]
+        if _UPPERCASE_START_RE.match(next_line):
+            return True
+        if not _BLANK_LINE_RE.fullmatch(next_line):
+            return False
+    return False
+
+
+def _is_bracket_head(lines: List[str], i: int) -> bool:
+    """True if lines[i] starts a "[N]" entry."""
+    line = lines[i]
+    if _BRACKET_HEAD_RE.match(line):
+        return True
+    # "[N]" alone on a line, with the entry text on the following line(s)
+    return i + 1 < len(lines) and _BRACKET_BARE_HEAD_RE.fullmatch(line) is not None
+
+
+def _is_apa_head(lines: List[str], i: int) -> bool:
+    """True if lines[i] starts an "Author, I." entry."""
+    return _APA_ENTRY_START_RE.match(lines[i]) is not None
+
+
+def _group_reference_lines(lines: List[str], is_head) -> List[List[str]]:
+    """
+    Single pass over lines, starting a new group at every entry head.
+    The first group holds any lines before the first head.
+    """
+    groups: List[List[str]] = [[]]
+    for i, line in enumerate(lines):
+        if i > 0 and is_head(lines, i):
+            groups.append([line])
+        else:
+            groups[-1].append(line)
+    return groups
+
+
 def parse_citations_deterministic(ref_section: str, citation_style: str) -> Dict[str, str]:
     """
     Parse citations deterministically based on detected style.
     Returns dict mapping citation_id -> citation_text
     """
     citations = {}
+    # splitlines() also breaks on \r and form feeds left by PDF extraction
+    lines = ref_section.splitlines()
 
-    if citation_style in ('numeric', 'vancouver'):
-        # Split at lines that start a new numbered entry: "N." or "N " followed
-        # by an uppercase letter.  This avoids splitting on mid-entry lines like
+    if citation_style in ('numeric', 'vancouver', 'bracket_numeric'):
+        # Numeric: new entries start at lines beginning "N." or "N " followed by
+        # an uppercase letter.  This avoids splitting on mid-entry lines like
         # "73: 3210" (journal volume) which start with a digit but no uppercase.
-        entries = re.split(r'\n(?=\d+\.?\s+[A-Z])', ref_section)
-        for entry in entries:
-            entry = entry.strip()
-            if not entry:
-                continue
-            m = re.match(r'^(\d+)\.?\s+(.+)', entry, re.DOTALL)
-            if m:
-                key = m.group(1)
-                text = re.sub(r'\s+', ' ', m.group(2)).strip()
-                citations[key] = text
+        # Bracketed: new entries start at lines beginning "[N]".
+        if citation_style == 'bracket_numeric':
+            is_head, entry_re = _is_bracket_head, _BRACKET_ENTRY_RE
+        else:
+            is_head, entry_re = _is_numeric_head, _NUMERIC_ENTRY_RE
 
-    elif citation_style == 'bracket_numeric':
-        # Split at lines starting "[N]"
-        entries = re.split(r'\n(?=\[\d+\]\s)', ref_section)
-        for entry in entries:
-            entry = entry.strip()
+        for group in _group_reference_lines(lines, is_head):
+            entry = '\n'.join(group).strip()
             if not entry:
                 continue
-            m = re.match(r'^\[(\d+)\]\s+(.+)', entry, re.DOTALL)
+            m = entry_re.match(entry)
             if m:
                 key = m.group(1)
-                text = re.sub(r'\s+', ' ', m.group(2)).strip()
+                text = _WHITESPACE_RE.sub(' ', m.group(2)).strip()
                 citations[key] = text
 
     elif citation_style == 'apa':
         # Parse "Smith, J. (2020). Title..."
-        lines = ref_section.split('\n')
-        current_citation: List[str] = []
-
-        for line in lines:
-            line = line.strip()
-            if not line:
+        stripped = [line for line in map(str.strip, lines) if line]
+        for group in _group_reference_lines(stripped, _is_apa_head):
+            # Lines before the first author entry are not a citation
+            if not group or not _APA_ENTRY_START_RE.match(group[0]):
                 continue
-            if re.match(r'^\w+,\s+\w\.', line):
-                if current_citation:
-                    text = ' '.join(current_citation)
-                    key = current_citation[0].split(',')[0].strip()
-                    citations[key] = text
-                current_citation = [line]
-            else:
-                if current_citation:
-                    current_citation.append(line)
-
-        if current_citation:
-            text = ' '.join(current_citation)
-            key = current_citation[0].split(',')[0].strip()
-            citations[key] = text
+            key = group[0].split(',')[0].strip()
+            citations[key] = ' '.join(group)
 
     return citations
 
@@ -188,10 +428,43 @@ def validate_citations(citations: Dict[str, str], min_citations: int = 1) -> boo
     return valid_count >= max(1, len(citations) * 0.8)
 
 
+@lru_cache(maxsize=None)
+def _get_encoding(model: str):
+    """Load the tiktoken encoding for model once; building the BPE table is expensive."""
+    return tiktoken.encoding_for_model(model)
+
+
 def count_tokens(text: str, model: str = "gpt-4o-mini") -> int:
     """Count tokens in text using tiktoken"""
-    encoding = tiktoken.encoding_for_model(model)
-    return len(encoding.encode(text))
+    # PDF text is plain text: encode_ordinary skips the special-token scan and
+    # does not raise on literal "<|endoftext|>" strings.
+    return len(_get_encoding(model).encode_ordinary(text))
+
+
+def _split_sentences(text: str) -> List[str]:
+    """
+    Split text at sentence-ending punctuation followed by whitespace, except
+    after a known abbreviation ("et al.", "e.g.", "Fig.", ...), or after an
+    ambiguous one ("etc.", "Inc.", ...) when the next word is lower-case.
+    """
+    sentences = []
+    start = 0
+    for match in _SENTENCE_SPLIT_RE.finditer(text):
+        end = match.start()
+        if text[end - 1] == '.':
+            # Word immediately before the boundary, e.g. "(e.g." or "al."
+            word_start = end - 1
+            while word_start > start and not text[word_start - 1].isspace():
+                word_start -= 1
+            word = text[word_start:end].lstrip('([{"\'').rstrip('.').lower()
+            if word in _NON_TERMINAL_ABBREVIATIONS:
+                continue
+            if word in _AMBIGUOUS_ABBREVIATIONS and text[match.end():match.end() + 1].islower():
+                continue
+        sentences.append(text[start:end])
+        start = match.end()
+    sentences.append(text[start:])
+    return sentences
 
 
 def semantic_chunk_text(text: str, chunk_size: int = CHUNK_SIZE, overlap: int = CHUNK_OVERLAP) -> List[Dict[str, Any]]:
@@ -212,20 +485,25 @@ def semantic_chunk_text(text: str, chunk_size: int = CHUNK_SIZE, overlap: int =
         List of dicts with chunk_id, text, start_pos, end_pos, token_count
     """
     # Split into sentences at natural boundaries
-    sentences = re.split(r'(?<=[.!?])\s+', text)
+    sentences = _split_sentences(text)
+    # Tokenize every sentence once up front; chunks carry (sentence, token_count)
+    # pairs so overlap handling never re-encodes text.
+    token_counts = [
+        len(ids) for ids in _get_encoding("gpt-4o-mini").encode_ordinary_batch(
+            sentences, num_threads=os.cpu_count() or 1
+        )
+    ]
     
     chunks = []
     current_chunk = []
     current_tokens = 0
     chunk_start_pos = 0
     
-    for sentence in sentences:
-        sentence_tokens = count_tokens(sentence)
-        
+    for sentence, sentence_tokens in zip(sentences, token_counts):
         # Check if adding this sentence would exceed chunk size
         if current_tokens + sentence_tokens > chunk_size and current_chunk:
             # Finalize current chunk
-            chunk_text = ' '.join(current_chunk)
+            chunk_text = ' '.join(s for s, _ in current_chunk)
             chunks.append({
                 'chunk_id': len(chunks),
                 'text': chunk_text,
@@ -236,31 +514,34 @@ def semantic_chunk_text(text: str, chunk_size: int = CHUNK_SIZE, overlap: int =
             
             # Start new chunk with character overlap from previous chunk
             if overlap > 0 and len(chunk_text) >= overlap:
-                overlap_text = chunk_text[-overlap:]
                 # Find sentence boundary within overlap text
                 overlap_sentences = []
-                temp_text = overlap_text
-                for sent in reversed(current_chunk):
-                    if len(' '.join([sent] + overlap_sentences)) <= overlap:
-                        overlap_sentences.insert(0, sent)
+                overlap_len = -1
+                overlap_tokens = 0
+                for sent, sent_tokens in reversed(current_chunk):
+                    if overlap_len + 1 + len(sent) <= overlap:
+                        overlap_sentences.append((sent, sent_tokens))
+                        overlap_len += 1 + len(sent)
+                        overlap_tokens += sent_tokens
                     else:
                         break
+                overlap_sentences.reverse()
                 
-                current_chunk = overlap_sentences + [sentence]
-                current_tokens = sum(count_tokens(s) for s in current_chunk)
+                current_chunk = overlap_sentences + [(sentence, sentence_tokens)]
+                current_tokens = overlap_tokens + sentence_tokens
                 # Adjust start position accounting for overlap
-                chunk_start_pos = chunk_start_pos + len(chunk_text) - len(' '.join(overlap_sentences))
+                chunk_start_pos = chunk_start_pos + len(chunk_text) - max(overlap_len, 0)
             else:
-                current_chunk = [sentence]
+                current_chunk = [(sentence, sentence_tokens)]
                 current_tokens = sentence_tokens
                 chunk_start_pos += len(chunk_text) + 1  # +1 for space
         else:
-            current_chunk.append(sentence)
+            current_chunk.append((sentence, sentence_tokens))
             current_tokens += sentence_tokens
     
     # Add final chunk
     if current_chunk:
-        chunk_text = ' '.join(current_chunk)
+        chunk_text = ' '.join(s for s, _ in current_chunk)
         chunks.append({
             'chunk_id': len(chunks),
             'text': chunk_text,
@@ -277,17 +558,7 @@ def extract_citation_markers(text: str) -> List[str]:
     Extract citation markers from text.
     Returns list of citation markers found (e.g., ["[1]", "[2]", "(Smith, 2020)"])
     """
-    markers = []
-    
-    # Numeric citations: [1], [2], etc.
-    numeric = re.findall(r'\[\d+\]', text)
-    markers.extend(numeric)
-    
-    # Author-year citations: (Smith, 2020), (Jones et al., 2019)
-    author_year = re.findall(r'\([A-Z][a-z]+(?:\s+et al\.)?,\s+\d{4}\)', text)
-    markers.extend(author_year)
-    
     # Superscript numbers (captured as regular numbers after superscript)
     # This is tricky with plain text - may need special handling
-    
-    return list(set(markers))  # Remove duplicates
+    # dict.fromkeys dedups while keeping first-occurrence (document) order
+    return list(dict.fromkeys(m.group() for m in _CITATION_MARKER_RE.finditer(text)))
@@ -1,7 +1,7 @@
 """Pydantic models for structured data"""
 
-from pydantic import BaseModel, Field, model_validator
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, Field, TypeAdapter, model_validator
+from typing import Optional, List, Dict, Any, Literal
 from datetime import datetime
 
 
@@ -28,6 +28,18 @@ class LocationInText(BaseModel):
     chunk_id: Optional[int] = None
 
 
+class ExtractedClaimSchema(BaseModel):
+    """Response schema for one claim returned by the Step 1 claim-extraction LLM call.
+
+    Passed to Gemini as ``response_schema`` so decoding is constrained to this
+    shape; ``claim_type`` is an enum so the model cannot emit other labels.
+    """
+    claim_text: str
+    claim_type: Literal["quantitative", "qualitative"]
+    citation_marker: Optional[str] = None
+    is_original: bool
+
+
 class FoundDatasetSource(BaseModel):
     """Dataset source found by sourcefinder for originally uncited claims"""
     source_url: str
@@ -121,3 +133,7 @@ class SourceManifestEntry(BaseModel):
     batch_num_claims: int = 0
     batch_download_successful: bool = False
     found_source: Optional[FoundDatasetSource] = None
+
+
+# Validate whole lists in one pydantic-core call instead of one call per item
+CLAIM_LIST_ADAPTER = TypeAdapter(List[ClaimObject])
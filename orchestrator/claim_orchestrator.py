@@ -3,14 +3,21 @@
 import json
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any, Tuple
 from collections import defaultdict
 
+try:
+    # orjson (de)serializes large result/claim files several times faster; json is the fallback
+    import orjson
+except ImportError:
+    orjson = None
+
 from models import (
     ClaimObject, ValidationResult, ValidationBatch, CitationDetails,
-    ResolutionAttempt, SourceManifestEntry,
+    ResolutionAttempt, SourceManifestEntry, CLAIM_LIST_ADAPTER,
 )
 from hybrid_citation_scraper.llm_client import LLMClient
 from run_paths import RunPaths
@@ -26,6 +33,23 @@ from .process_qualitative import ProcessQualitative
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Concurrent truth-table + LLM plausibility checks. Both are independent
+# network calls per claim; sourcefinder/browser steps stay sequential.
+_CLAIM_CHECK_MAX_WORKERS = 8
+# Script generation (LLM) + execution (subprocess) for claims sharing one
+# downloaded dataset; each claim writes its own validate_<claim_id>.py.
+_SCRIPT_VALIDATION_MAX_WORKERS = 4
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize values json/orjson reject in free-form validation_metadata."""
+    # numpy scalars and arrays from dataset validation
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return str(value)
+
 
 def _setup_file_logging(log_path: Path) -> Path:
     """Add a file handler writing to ``log_path`` to the root logger."""
@@ -191,14 +215,17 @@ class ClaimOrchestrator:
         self.text_downloader._paper_finder.browser_searcher = self.browser_searcher
 
         # Detect which paywall domains appear in the citation text or claim URLs
-        all_text = " ".join(citations.values())
-        for claim in claims:
-            if claim.citation_details and claim.citation_details.url:
-                all_text += " " + claim.citation_details.url
+        text_parts = list(citations.values())
+        text_parts.extend(
+            claim.citation_details.url
+            for claim in claims
+            if claim.citation_details and claim.citation_details.url
+        )
+        all_text = " ".join(text_parts).lower()
 
         paywall_domains_needed = [
             domain for domain in KNOWN_PAYWALL_DOMAINS
-            if domain in all_text.lower()
+            if domain in all_text
         ]
 
         if not paywall_domains_needed:
@@ -218,16 +245,33 @@ class ClaimOrchestrator:
         input()
         logger.info("User completed login — continuing pipeline")
 
+    def _check_claims(
+        self, claims: List[ClaimObject]
+    ) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Run the truth-table and LLM plausibility checks for every claim concurrently.
+        Returns (tt_result, llm_result) pairs in the same order as ``claims``.
+        """
+        def verify(claim: ClaimObject) -> Dict[str, Any]:
+            logger.info(f"  Checking: {claim.claim_id}")
+            return self.llm_verifier.verify_claim(claim.text)
+
+        if not claims:
+            return []
+        workers = min(_CLAIM_CHECK_MAX_WORKERS, len(claims))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            llm_results = executor.map(verify, claims)
+            # Fact-check lookups run on the checker's own pool meanwhile
+            tt_results = self.truth_table.check_claims([claim.text for claim in claims])
+            return list(zip(tt_results, llm_results))
+
     def _process_uncited_qualitative(self, claims: List[ClaimObject]) -> List[ValidationResult]:
         """Process qualitative claims without citations: Truth Table + LLM Check"""
         results = []
 
-        for claim in claims:
+        for claim, (tt_result, llm_result) in zip(claims, self._check_claims(claims)):
             logger.info(f"  Validating: {claim.claim_id}")
 
-            tt_result = self.truth_table.check_claim(claim.text)
-            llm_result = self.llm_verifier.verify_claim(claim.text)
-
             passed = tt_result['found'] or llm_result['plausible']
             confidence = max(tt_result['confidence'], llm_result['confidence'])
 
@@ -268,12 +312,9 @@ class ClaimOrchestrator:
         claims_to_route: List[ClaimObject] = []
         direct_results: List[ValidationResult] = []
 
-        for claim in claims:
+        for claim, (tt_result, llm_result) in zip(claims, self._check_claims(claims)):
             logger.info(f"  Processing: {claim.claim_id}")
 
-            tt_result = self.truth_table.check_claim(claim.text)
-            llm_result = self.llm_verifier.verify_claim(claim.text)
-
             # Branch A: Truth-table / LLM strongly verified — no dataset needed.
             if (tt_result['found'] and tt_result['confidence'] > 0.8) or \
                (llm_result['plausible'] and llm_result['confidence'] > 0.8):
@@ -462,12 +503,7 @@ class ClaimOrchestrator:
 
             logger.info(f"    ✓ Downloaded dataset: {download_result['path']}")
 
-            claim_results = []
-            for claim in claims_group:
-                logger.info(f"      Validating: {claim.claim_id}")
-                result = self.quant_processor.validate_claim(claim, download_result['path'])
-                claim_results.append(result)
-                logger.info(f"        Result: {'PASSED' if result.passed else 'FAILED'}")
+            claim_results = self._validate_against_dataset(claims_group, download_result['path'])
 
             delete_result = self.dataset_downloader.delete_dataset(Path(download_result['path']).name)
             if delete_result['deleted']:
@@ -491,6 +527,23 @@ class ClaimOrchestrator:
 
         return batch_results
 
+    def _validate_against_dataset(
+        self, claims: List[ClaimObject], dataset_path: str
+    ) -> List[ValidationResult]:
+        """
+        Run the script validator for every claim against one dataset concurrently.
+        Results are returned in the same order as ``claims``.
+        """
+        def validate(claim: ClaimObject) -> ValidationResult:
+            logger.info(f"      Validating: {claim.claim_id}")
+            result = self.quant_processor.validate_claim(claim, dataset_path)
+            logger.info(f"        {claim.claim_id}: {'PASSED' if result.passed else 'FAILED'}")
+            return result
+
+        workers = min(_SCRIPT_VALIDATION_MAX_WORKERS, len(claims))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(validate, claims))
+
     def _process_paper_backed_quant(
         self, claims: List[ClaimObject]
     ) -> List[ValidationBatch]:
@@ -778,8 +831,30 @@ class ClaimOrchestrator:
                 else:
                     serialized_results.append(result)
 
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(serialized_results, f, indent=2, ensure_ascii=False)
+            payload = None
+            if orjson is not None:
+                # OPT_NON_STR_KEYS matches json.dump's coercion of non-str keys
+                # in free-form validation_metadata. orjson writes NaN/Inf as null.
+                try:
+                    payload = orjson.dumps(
+                        serialized_results,
+                        default=_json_default,
+                        option=(
+                            orjson.OPT_INDENT_2
+                            | orjson.OPT_NON_STR_KEYS
+                            | orjson.OPT_SERIALIZE_NUMPY
+                        ),
+                    )
+                except orjson.JSONEncodeError as e:
+                    logger.warning(f"orjson could not encode {claim_type} results ({e}); using json")
+
+            if payload is not None:
+                output_path.write_bytes(payload)
+            else:
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    json.dump(
+                        serialized_results, f, indent=2, ensure_ascii=False, default=_json_default
+                    )
 
             logger.info(f"✓ Saved {claim_type} results to: {output_path}")
 
@@ -794,9 +869,12 @@ class ClaimOrchestrator:
         Returns:
             Tuple[List[ClaimObject], Dict[str, str]] — claims and citations dict
         """
-        with open(json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        claims = [ClaimObject(**c) for c in data["claims"]]
+        if orjson is not None:
+            data = orjson.loads(Path(json_path).read_bytes())
+        else:
+            with open(json_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        claims = CLAIM_LIST_ADAPTER.validate_python(data["claims"])
         citations = data.get("citations", {})
         logger.info(f"Loaded {len(claims)} claims and {len(citations)} citations from {json_path}")
         return claims, citations
@@ -16,7 +16,6 @@ Cookie-based institutional auth fallback:
 import json
 import logging
 import re
-import requests
 from typing import Optional, Dict, Any
 from urllib.parse import urlparse
 
@@ -29,6 +28,7 @@ from .config import (
     INSTITUTIONAL_COOKIES,
     DOWNLOAD_TIMEOUT,
 )
+from .http_session import make_api_session
 
 logger = logging.getLogger(__name__)
 
@@ -56,7 +56,7 @@ class AcademicPaperFinder:
     def __init__(self, llm_client=None):
         self.llm_client = llm_client
         self.browser_searcher = None  # injected by orchestrator after startup login
-        self._session = requests.Session()
+        self._session = make_api_session()
         self._session.headers["User-Agent"] = (
             "ASV-pipeline/1.0 (academic source validation; contact via project repo)"
         )
@@ -48,6 +48,9 @@ class BrowserSearcher:
         self._playwright = None
         self._browser = None
         self._context = None
+        # Ranked URLs per (search_url, top_k). Claims in one paper often repeat
+        # the same query, and each miss costs a page load plus an LLM call.
+        self._search_cache: dict[tuple[str, int], list[str]] = {}
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -198,7 +201,13 @@ class BrowserSearcher:
         """
         Navigate to a search results URL, extract candidate links, ask the LLM to
         rank them, and return the top_k most relevant URLs.
+        Successful searches are cached for the lifetime of this searcher.
         """
+        cache_key = (search_url, top_k)
+        if cache_key in self._search_cache:
+            logger.info(f"  {source_label}: reusing cached results for {search_url}")
+            return list(self._search_cache[cache_key])
+
         self._ensure_started()
         page = self._context.new_page()
         try:
@@ -218,6 +227,8 @@ class BrowserSearcher:
         logger.info(f"  {source_label}: {len(candidates)} candidate links found; asking LLM to rank")
         ranked = self._rank_links_with_llm(query, candidates, top_k)
         logger.info(f"  {source_label}: LLM returned {len(ranked)} ranked URLs")
+        if ranked:
+            self._search_cache[cache_key] = ranked
         return ranked
 
     def _extract_candidate_links(self, page) -> list[dict]:
@@ -257,9 +268,12 @@ class BrowserSearcher:
             if len(anchor_text) < 5:
                 continue  # skip icon-only / empty links
 
-            if href in seen_urls:
+            # Result pages often link one item several times (title, thumbnail,
+            # "#cite" anchors); rank each target once.
+            url_key = urllib.parse.urldefrag(href)[0].rstrip("/")
+            if url_key in seen_urls:
                 continue
-            seen_urls.add(href)
+            seen_urls.add(url_key)
 
             # Grab a short context snippet from the surrounding paragraph/div
             parent = a.find_parent(["p", "div", "li", "td"])
@@ -310,7 +324,9 @@ If none are relevant, return {{"selected_indices": [], "reasoning": "..."}}
             urls = []
             for idx in indices:
                 if isinstance(idx, int) and 1 <= idx <= len(candidates):
-                    urls.append(candidates[idx - 1]["url"])
+                    url = candidates[idx - 1]["url"]
+                    if url not in urls:
+                        urls.append(url)
             return urls[:top_k]
         except Exception as e:
             logger.warning(f"  LLM link ranking failed: {e}; returning first {top_k} candidates")
@@ -32,6 +32,12 @@ DATASET_REUSE_THRESHOLD = 0.75  # LLM confidence threshold for reusing datasets
 DOWNLOAD_TIMEOUT = 60
 MAX_FILE_SIZE_MB = 500
 
+# On-disk HTTP cache for open-access / repository API lookups (requests-cache).
+# Only the metadata API hosts below are cached; paper and dataset payloads are not.
+ENABLE_HTTP_CACHE = False
+HTTP_CACHE_PATH = "~/.cache/asv/http_cache.sqlite"
+HTTP_CACHE_EXPIRE_SECONDS = 86400
+
 # Output directories
 DATASET_OUTPUT_DIR = "./datasets"
 TEXT_OUTPUT_DIR = "./text_sources"
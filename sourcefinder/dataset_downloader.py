@@ -1,20 +1,35 @@
 """Dataset Downloader - Download datasets (CSV, JSON, Excel)"""
 
-import io
+import codecs
 import json
 import logging
+import os
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
 import pandas as pd
 import requests
 
-from .config import DOWNLOAD_TIMEOUT, DATASET_OUTPUT_DIR
+try:
+    # orjson parses large JSON datasets several times faster; json is the fallback
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+from .config import DOWNLOAD_TIMEOUT, DATASET_OUTPUT_DIR, MAX_FILE_SIZE_MB
+from .http_session import mount_pooled_adapter
 from run_paths import RunPaths
 
 logger = logging.getLogger(__name__)
 
 
+def _parse_json_bytes(data: bytes) -> Any:
+    """Parse a UTF-8 JSON payload, tolerating a leading byte-order mark."""
+    if data.startswith(codecs.BOM_UTF8):
+        data = data[len(codecs.BOM_UTF8):]
+    return _json_loads(data)
+
+
 class DatasetDownloader:
     """Download datasets (CSV, JSON, Excel).
 
@@ -27,6 +42,22 @@ class DatasetDownloader:
     # (format, error) — error is set when the payload is not a dataset.
     _NOT_TABULAR: Tuple[str, str] = ("__not_tabular__", "URL is not tabular data")
 
+    # Response bodies are streamed to disk in blocks of this size.
+    _DOWNLOAD_CHUNK_BYTES = 64 * 1024
+    _MAX_DOWNLOAD_BYTES = MAX_FILE_SIZE_MB * 1024 * 1024
+    _SNIFF_BYTES = 512
+    # _sniff_format verdicts that depend only on the head and content-type, so
+    # the rest of the body need not be fetched.
+    _EARLY_REJECT_KINDS = frozenset({
+        "application/pdf", "text/html", "application/zip (not spreadsheet)",
+    })
+    # kind_description for un-hinted JSON; _sniff_format only returns it after
+    # parsing the full body, so the readability check need not parse it again.
+    _SNIFFED_JSON_KIND = "application/json (sniffed)"
+    # Rows parsed by the pandas fallbacks of the readability checks.
+    _CSV_CHECK_ROWS = 1000
+    _EXCEL_CHECK_ROWS = 1000
+
     def __init__(
         self,
         run_paths: Optional[RunPaths] = None,
@@ -40,7 +71,7 @@ class DatasetDownloader:
         else:
             self.output_dir = Path(DATASET_OUTPUT_DIR)
             self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.session = requests.Session()
+        self.session = mount_pooled_adapter(requests.Session())
         # No application/json in Accept: DOI URLs content-negotiate to
         # CrossRef bibliographic metadata when JSON is offered, which downstream
         # code would mistake for a real dataset.
@@ -71,13 +102,51 @@ class DatasetDownloader:
             'error': None,
         }
 
+        partial_path = self.output_dir / f"citation_{citation_id}_dataset.part"
+        local_path: Optional[Path] = None
         try:
             logger.info(f"Downloading dataset from: {url}")
-            response = self.session.get(url, timeout=DOWNLOAD_TIMEOUT)
-            response.raise_for_status()
-
-            content_type = response.headers.get('content-type', '').lower()
-            file_format, detected_kind = self._sniff_format(url, content_type, response.content)
+            # Stream straight to disk so memory stays bounded by the chunk
+            # size rather than the dataset size.
+            with self.session.get(url, timeout=DOWNLOAD_TIMEOUT, stream=True) as response:
+                response.raise_for_status()
+                content_type = response.headers.get('content-type', '').lower()
+
+                # Headers arrive before the body: refuse oversized payloads
+                # without transferring them.
+                declared = response.headers.get('content-length', '')
+                if declared.isdigit() and int(declared) > self._MAX_DOWNLOAD_BYTES:
+                    err = f"Dataset exceeds {MAX_FILE_SIZE_MB} MB (content-length {declared})"
+                    result['error'] = err
+                    logger.info(f"  ✗ {err}")
+                    return result
+
+                head = b""
+                written = 0
+                with open(partial_path, 'wb') as f:
+                    for chunk in response.iter_content(self._DOWNLOAD_CHUNK_BYTES):
+                        if len(head) < self._SNIFF_BYTES:
+                            head += chunk[:self._SNIFF_BYTES - len(head)]
+                            if len(head) == self._SNIFF_BYTES:
+                                # PDFs and HTML pages are recognisable from the
+                                # head alone; stop before pulling the rest.
+                                _, kind = self._sniff_format(url, content_type, head)
+                                if kind in self._EARLY_REJECT_KINDS:
+                                    err = f"URL is not tabular data (detected: {kind})"
+                                    result['error'] = err
+                                    logger.info(f"  ✗ {err}")
+                                    return result
+                        f.write(chunk)
+                        written += len(chunk)
+                        if written > self._MAX_DOWNLOAD_BYTES:
+                            err = f"Dataset exceeds {MAX_FILE_SIZE_MB} MB"
+                            result['error'] = err
+                            logger.info(f"  ✗ {err}")
+                            return result
+
+            file_format, detected_kind = self._sniff_format(
+                url, content_type, head, body_path=partial_path
+            )
 
             if file_format is None:
                 # Non-tabular payload — reject cleanly so caller can iterate.
@@ -86,28 +155,25 @@ class DatasetDownloader:
                 logger.info(f"  ✗ {err}")
                 return result
 
+            if file_format not in ('csv', 'json', 'xlsx', 'xls'):
+                # Should not happen — _sniff_format returns None for unknown formats.
+                result['error'] = f"Unhandled format: {file_format}"
+                logger.error(f"  ✗ {result['error']}")
+                return result
+
             filename = f"citation_{citation_id}_dataset.{file_format}"
             local_path = self.output_dir / filename
+            os.replace(partial_path, local_path)
 
-            # Parse from already-downloaded bytes — no second HTTP fetch.
+            # Parse the saved file once to confirm it is readable, keeping the
+            # original bytes rather than re-serializing through pandas.
             if file_format == 'csv':
-                df = pd.read_csv(io.BytesIO(response.content))
-                df.to_csv(local_path, index=False)
+                self._check_csv_readable(local_path)
             elif file_format == 'json':
-                data = response.json()
-                with open(local_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2)
-            elif file_format == 'xlsx':
-                df = pd.read_excel(io.BytesIO(response.content))
-                df.to_excel(local_path, index=False)
-            elif file_format == 'xls':
-                df = pd.read_excel(io.BytesIO(response.content))
-                df.to_excel(local_path, index=False)
+                if detected_kind != self._SNIFFED_JSON_KIND:
+                    _parse_json_bytes(local_path.read_bytes())
             else:
-                # Should not happen — _sniff_format returns None for unknown formats.
-                result['error'] = f"Unhandled format: {file_format}"
-                logger.error(f"  ✗ {result['error']}")
-                return result
+                self._check_excel_readable(local_path, file_format)
 
             result['downloaded'] = True
             result['format'] = file_format
@@ -115,18 +181,74 @@ class DatasetDownloader:
             logger.info(f"✓ Downloaded to: {local_path}")
 
         except Exception as e:
+            # Don't leave an unreadable file behind for the validator to pick up.
+            if local_path is not None:
+                local_path.unlink(missing_ok=True)
             result['error'] = str(e)
             logger.error(f"✗ Download failed: {e}")
 
+        finally:
+            partial_path.unlink(missing_ok=True)
+
         return result
 
+    def _check_csv_readable(self, path: Path) -> None:
+        """
+        Raise if the CSV at ``path`` cannot be parsed.
+
+        Only the leading block is read — the validator loads the full file
+        later, so a multi-GB download need not be held in memory here. Uses
+        pyarrow's multi-threaded reader when installed, pandas otherwise.
+        """
+        try:
+            from pyarrow import csv as pa_csv
+        except ImportError:
+            pd.read_csv(path, nrows=self._CSV_CHECK_ROWS)
+            return
+        reader = pa_csv.open_csv(path)
+        try:
+            reader.read_next_batch()
+        except StopIteration:
+            pass  # header-only CSV
+        finally:
+            reader.close()
+
+    def _check_excel_readable(self, path: Path, file_format: str) -> None:
+        """
+        Raise if the workbook at ``path`` cannot be opened.
+
+        .xlsx files are opened with openpyxl in read-only mode, which streams
+        rows instead of building the whole sheet, and only the first row is
+        read. Legacy .xls (or a missing openpyxl) goes through pandas with a
+        row cap.
+        """
+        if file_format == 'xlsx':
+            try:
+                from openpyxl import load_workbook
+            except ImportError:
+                load_workbook = None
+            if load_workbook is not None:
+                workbook = load_workbook(path, read_only=True, data_only=True)
+                try:
+                    sheet = workbook.active
+                    if sheet is not None:
+                        next(sheet.iter_rows(max_row=1), None)
+                finally:
+                    workbook.close()
+                return
+        pd.read_excel(path, nrows=self._EXCEL_CHECK_ROWS)
+
     @staticmethod
     def _sniff_format(
-        url: str, content_type: str, content: bytes
+        url: str, content_type: str, content: bytes, body_path: Optional[Path] = None
     ) -> Tuple[Optional[str], str]:
         """
         Detect payload format from magic bytes + content-type + URL hints.
 
+        ``content`` needs to cover at least the first 512 bytes. When it is only
+        the head of a payload saved at ``body_path``, the full body is read from
+        disk for the un-hinted JSON parse check.
+
         Returns (format, kind_description). ``format`` is None when the payload
         is not a dataset we can parse; ``kind_description`` names what we
         detected so callers can surface it in error messages.
@@ -172,8 +294,9 @@ class DatasetDownloader:
         # 4) Content-based guess for un-hinted text payloads.
         if head_stripped.startswith(b"{") or head_stripped.startswith(b"["):
             try:
-                json.loads(content.decode("utf-8", errors="strict"))
-                return 'json', 'application/json (sniffed)'
+                body = body_path.read_bytes() if body_path is not None else content
+                _parse_json_bytes(body)
+                return 'json', DatasetDownloader._SNIFFED_JSON_KIND
             except (UnicodeDecodeError, json.JSONDecodeError):
                 pass
         # CSV heuristic: first non-empty line contains commas and decodes as text.
@@ -2,16 +2,16 @@
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 
-import requests
-
 from models import FoundDatasetSource
 from hybrid_citation_scraper.llm_client import LLMClient
 from run_paths import RunPaths
 from .config import DATA_GOV_API, KAGGLE_USERNAME, KAGGLE_KEY, DEFAULT_TOP_K, DOWNLOAD_TIMEOUT
+from .http_session import make_api_session
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +24,7 @@ class DatasetFinder:
         self.found_datasets: List[FoundDatasetSource] = []
         self.browser_searcher = None  # injected by orchestrator after startup login
         self.run_paths = run_paths
+        self._session = make_api_session()
 
     def save_discovery_records(self) -> Optional[Path]:
         """Flush in-memory dataset discoveries to the run's sourcefinder folder."""
@@ -140,12 +141,18 @@ Return JSON: {{"can_reuse": true/false, "dataset_index": 1-{len(datasets)} or nu
         candidates = []
         query = claim_text[:100]
 
-        candidates.extend(self._search_data_gov(query))
+        searches = [self._search_data_gov]
         if KAGGLE_USERNAME and KAGGLE_KEY:
-            candidates.extend(self._search_kaggle(query))
+            searches.append(self._search_kaggle)
         else:
             logger.debug("Kaggle credentials not set; skipping Kaggle search")
 
+        # The repository APIs are independent network round-trips; query them
+        # concurrently. map() keeps data.gov results ahead of Kaggle's.
+        with ThreadPoolExecutor(max_workers=len(searches)) as executor:
+            for results in executor.map(lambda search: search(query), searches):
+                candidates.extend(results)
+
         # Browser fallback: Zenodo, Figshare, HuggingFace
         if not candidates and self.browser_searcher is not None:
             logger.info("APIs returned no results — falling back to browser search (Zenodo/Figshare/HuggingFace)")
@@ -153,7 +160,19 @@ Return JSON: {{"can_reuse": true/false, "dataset_index": 1-{len(datasets)} or nu
 
         if not candidates:
             logger.warning(f"No dataset candidates found for query: {query[:60]}...")
-        return candidates
+        return self._dedupe_candidates(candidates)
+
+    @staticmethod
+    def _dedupe_candidates(candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop repeated URLs, keeping the first (highest-priority source) hit."""
+        seen = set()
+        unique = []
+        for candidate in candidates:
+            if candidate["url"] in seen:
+                continue
+            seen.add(candidate["url"])
+            unique.append(candidate)
+        return unique
 
     def _search_browser(self, query: str) -> List[Dict[str, Any]]:
         """Search Zenodo, Figshare, and HuggingFace Datasets via browser."""
@@ -185,7 +204,7 @@ Return JSON: {{"can_reuse": true/false, "dataset_index": 1-{len(datasets)} or nu
         """Search data.gov CKAN API for relevant datasets."""
         candidates = []
         try:
-            response = requests.get(
+            response = self._session.get(
                 DATA_GOV_API,
                 params={"q": query, "rows": DEFAULT_TOP_K},
                 timeout=DOWNLOAD_TIMEOUT,
@@ -0,0 +1,83 @@
+"""HTTP session setup for source resolution and downloads"""
+
+import logging
+import os
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .config import (
+    UNPAYWALL_API,
+    SEMANTIC_SCHOLAR_API,
+    CROSSREF_API,
+    DATA_GOV_API,
+    ENABLE_HTTP_CACHE,
+    HTTP_CACHE_PATH,
+    HTTP_CACHE_EXPIRE_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+# Hosts whose JSON responses are stable enough to reuse across runs. Everything
+# else (landing pages, PDFs, cookie-authenticated fetches) bypasses the cache.
+_CACHED_API_HOSTS = tuple(
+    urlparse(url).netloc
+    for url in (UNPAYWALL_API, SEMANTIC_SCHOLAR_API, CROSSREF_API, DATA_GOV_API)
+)
+
+
+# Retry transient gateway errors with a short backoff, and a refused or reset
+# connection once; read timeouts are not retried (DOWNLOAD_TIMEOUT is long).
+# The final 5xx response is returned so callers' raise_for_status() reports it.
+# Retry-After is ignored: urllib3 sleeps for whatever a 503 asks, uncapped.
+_RETRY = Retry(
+    total=3,
+    connect=1,
+    read=0,
+    status=3,
+    backoff_factor=0.3,
+    status_forcelist=(500, 502, 503, 504),
+    raise_on_status=False,
+    respect_retry_after_header=False,
+)
+_POOL_SIZE = 32
+
+
+def mount_pooled_adapter(session: requests.Session) -> requests.Session:
+    """Give session a larger keep-alive pool and transient-error retries."""
+    adapter = HTTPAdapter(pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE, max_retries=_RETRY)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def make_api_session() -> requests.Session:
+    """
+    Session for DOI / repository API lookups.
+
+    With ENABLE_HTTP_CACHE on and requests-cache installed, successful GETs to
+    the API hosts are cached in a SQLite file for HTTP_CACHE_EXPIRE_SECONDS,
+    so repeated DOIs and queries skip the network. Otherwise a plain
+    requests.Session is returned.
+    """
+    if not ENABLE_HTTP_CACHE:
+        return mount_pooled_adapter(requests.Session())
+    try:
+        from requests_cache import CachedSession, DO_NOT_CACHE
+    except ImportError:
+        logger.debug("requests-cache not installed; API lookups are uncached")
+        return mount_pooled_adapter(requests.Session())
+
+    cache_path = os.path.expanduser(HTTP_CACHE_PATH)
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    urls_expire_after = {host: HTTP_CACHE_EXPIRE_SECONDS for host in _CACHED_API_HOSTS}
+    urls_expire_after["*"] = DO_NOT_CACHE
+    return mount_pooled_adapter(CachedSession(
+        cache_path,
+        backend="sqlite",
+        urls_expire_after=urls_expire_after,
+        allowable_codes=(200,),
+        allowable_methods=("GET",),
+    ))
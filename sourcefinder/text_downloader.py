@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 from .config import DOWNLOAD_TIMEOUT, TEXT_OUTPUT_DIR, INSTITUTIONAL_COOKIES
 from .academic_paper_finder import AcademicPaperFinder
+from .http_session import mount_pooled_adapter
 from run_paths import RunPaths
 
 logger = logging.getLogger(__name__)
@@ -28,7 +29,7 @@ class TextDownloader:
         else:
             self.output_dir = Path(TEXT_OUTPUT_DIR)
             self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.session = requests.Session()
+        self.session = mount_pooled_adapter(requests.Session())
         # Browser-like headers reduce trivial 403s from publishers that sniff UA.
         self.session.headers.update({
             'User-Agent': (
@@ -220,6 +221,22 @@ class TextDownloader:
         logger.warning(f"  All PDF extractors returned empty text for {pdf_path.name}")
         return ""
 
+    # Elements that never carry article text, and class/id fragments that mark
+    # junk containers (banners, cookie prompts, related-article rails, sign-in
+    # blocks).
+    _HTML_STRIP_TAGS = ("script", "style", "nav", "header", "footer",
+                        "aside", "form", "button", "noscript", "iframe")
+    _HTML_JUNK_PATTERNS = ("cookie", "banner", "signin", "sign-in", "login",
+                           "related", "sidebar", "advert", "promo", "footer",
+                           "header", "nav", "skip-link", "menu", "share",
+                           "citation-tools", "metrics", "altmetric")
+    # Common publisher selectors (Nature/Springer use ``.c-article-body``,
+    # ScienceDirect uses ``#body``, PMC uses ``.jig-ncbiinpagenav``…).
+    _HTML_CONTAINER_SELECTORS = ("article", "main", '[role="main"]',
+                                 ".c-article-body", ".article-body",
+                                 ".article__body", "#article-body",
+                                 "#main-content", "#content")
+
     def _extract_html_text(self, html_content: str) -> str:
         """
         Extract text from HTML.
@@ -236,76 +253,93 @@ class TextDownloader:
              ``[role="main"]``, or common publisher-specific selectors).
           3. If found, extract text only from that container. Otherwise fall back
              to whole-document text.
+
+        Parsing uses selectolax's lexbor backend (C) when installed, and
+        BeautifulSoup's pure-Python ``html.parser`` otherwise.
         """
         try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html_content, 'html.parser')
-
-            # 1. Kill non-content elements.
-            for tag in soup(["script", "style", "nav", "header", "footer",
-                             "aside", "form", "button", "noscript", "iframe"]):
-                tag.decompose()
-
-            # Kill common junk containers by class/id (banners, cookie prompts,
-            # related-article rails, sign-in blocks). Snapshot first — decompose()
-            # detaches descendants and iterating a live tree would then crash.
-            junk_patterns = ("cookie", "banner", "signin", "sign-in", "login",
-                             "related", "sidebar", "advert", "promo", "footer",
-                             "header", "nav", "skip-link", "menu", "share",
-                             "citation-tools", "metrics", "altmetric")
-
-            def _classes_of(el):
-                c = el.get("class")
-                if not c:
-                    return ""
-                return " ".join(c).lower() if isinstance(c, list) else str(c).lower()
-
-            junk_class_els = [
-                el for el in list(soup.find_all(attrs={"class": True}))
-                if el is not None and el.parent is not None
-                and any(p in _classes_of(el) for p in junk_patterns)
-            ]
-            for el in junk_class_els:
-                if el.parent is not None:
-                    el.decompose()
-
-            junk_id_els = [
-                el for el in list(soup.find_all(attrs={"id": True}))
-                if el is not None and el.parent is not None
-                and any(p in str(el.get("id", "")).lower() for p in junk_patterns)
-            ]
-            for el in junk_id_els:
-                if el.parent is not None:
-                    el.decompose()
-
-            # 2. Prefer a semantic article container.
-            #    Common publisher selectors (Nature/Springer use ``.c-article-body``,
-            #    ScienceDirect uses ``#body``, PMC uses ``.jig-ncbiinpagenav``…).
-            container = (
-                soup.find("article")
-                or soup.find("main")
-                or soup.find(attrs={"role": "main"})
-                or soup.find(class_="c-article-body")
-                or soup.find(class_="article-body")
-                or soup.find(class_="article__body")
-                or soup.find(id="article-body")
-                or soup.find(id="main-content")
-                or soup.find(id="content")
-                or soup.body
-                or soup
-            )
-
-            text = container.get_text(separator="\n")
-
-            # 3. Whitespace cleanup.
-            lines = (line.strip() for line in text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            text = "\n".join(chunk for chunk in chunks if chunk)
-            return text
+            try:
+                text = self._html_text_lexbor(html_content)
+            except ImportError:
+                text = self._html_text_bs4(html_content)
+
+            # 3. Whitespace cleanup: double spaces separate phrases like line
+            #    breaks do; one line per non-blank phrase.
+            return "\n".join(filter(None, map(str.strip, text.replace("  ", "\n").splitlines())))
         except Exception as e:
             logger.error(f"HTML extraction failed: {e}")
             return html_content
-    
+
+    def _is_junk_container(self, classes: str, element_id: str) -> bool:
+        classes = classes.lower()
+        element_id = element_id.lower()
+        return any(p in classes or p in element_id for p in self._HTML_JUNK_PATTERNS)
+
+    def _html_text_lexbor(self, html_content: str) -> str:
+        """Container text via selectolax (lexbor). Raises ImportError if missing."""
+        from selectolax.lexbor import LexborHTMLParser
+        tree = LexborHTMLParser(html_content)
+
+        # 1. Kill non-content elements, then junk containers by class/id. Walk
+        #    top-down and don't descend into a removed element, so no node
+        #    handle outlives the subtree decompose() frees.
+        tree.strip_tags(list(self._HTML_STRIP_TAGS))
+        root = tree.root
+        stack = [root] if root is not None else []
+        while stack:
+            for child in list(stack.pop().iter(include_text=False)):
+                attrs = child.attributes
+                if self._is_junk_container(attrs.get("class") or "", attrs.get("id") or ""):
+                    child.decompose()
+                else:
+                    stack.append(child)
+
+        # 2. Prefer a semantic article container.
+        container = None
+        for selector in self._HTML_CONTAINER_SELECTORS:
+            container = tree.css_first(selector)
+            if container is not None:
+                break
+        container = container or tree.body or tree.root
+        if container is None:
+            return ""
+        return container.text(separator="\n")
+
+    def _html_text_bs4(self, html_content: str) -> str:
+        """Container text via BeautifulSoup's ``html.parser``."""
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(html_content, 'html.parser')
+
+        # 1. Kill non-content elements.
+        for tag in soup(list(self._HTML_STRIP_TAGS)):
+            tag.decompose()
+
+        # Kill junk containers by class/id. Snapshot first — decompose()
+        # detaches descendants and iterating a live tree would then crash.
+        def _classes_of(el):
+            c = el.get("class")
+            if not c:
+                return ""
+            return " ".join(c) if isinstance(c, list) else str(c)
+
+        junk_els = [
+            el for el in list(soup.find_all(True))
+            if el is not None and el.parent is not None
+            and self._is_junk_container(_classes_of(el), str(el.get("id") or ""))
+        ]
+        for el in junk_els:
+            if el.parent is not None:
+                el.decompose()
+
+        # 2. Prefer a semantic article container.
+        container = None
+        for selector in self._HTML_CONTAINER_SELECTORS:
+            container = soup.select_one(selector)
+            if container is not None:
+                break
+        container = container or soup.body or soup
+        return container.get_text(separator="\n")
+
     def download_with_resolution(
         self,
         citation_details,           # CitationDetails | None
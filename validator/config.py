@@ -30,3 +30,11 @@ SCRIPT_MAX_OUTPUT_LENGTH = 10000
 # API keys
 GOOGLE_FACT_CHECK_API_KEY = os.getenv('GOOGLE_FACT_CHECK_API_KEY', '')
 
+# On-disk cache of Google Fact Check API responses, keyed by the normalized
+# query. Off by default; enable when re-running the pipeline on the same claims.
+# Empty ("no fact checks") responses expire sooner, as new reviews appear.
+ENABLE_FACT_CHECK_CACHE = False
+FACT_CHECK_CACHE_DIR = "~/.cache/asv/fact_check"
+FACT_CHECK_CACHE_TTL_SECONDS = 7 * 86400
+FACT_CHECK_CACHE_EMPTY_TTL_SECONDS = 86400
+
@@ -1,6 +1,7 @@
 """Python Script Validator - Tool for dataset-backed quantitative claim validation"""
 
 import subprocess
+import sys
 import logging
 from pathlib import Path
 from typing import Dict, Any, Optional
@@ -129,7 +130,7 @@ Generate ONLY the Python code, no explanations or markdown formatting.
         """Execute generated script and capture output."""
         try:
             result = subprocess.run(
-                ['python', str(script_path.resolve())],
+                [sys.executable, str(script_path.resolve())],
                 capture_output=True,
                 text=True,
                 timeout=30,
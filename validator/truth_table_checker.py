@@ -1,21 +1,78 @@
 """Truth Table Checker - Query Google Fact Check API and ClaimReview schema"""
 
+import hashlib
+import json
+import os
+import re
+import threading
+import time
 import requests
 import logging
-from typing import Dict, Any, List
-from .config import GOOGLE_FACT_CHECK_API_KEY, TRUTH_TABLE_CONFIDENCE_THRESHOLD
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+from requests.adapters import HTTPAdapter
+
+try:
+    # orjson parses fact-check responses several times faster; json is the fallback
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+from .config import (
+    GOOGLE_FACT_CHECK_API_KEY,
+    TRUTH_TABLE_CONFIDENCE_THRESHOLD,
+    ENABLE_FACT_CHECK_CACHE,
+    FACT_CHECK_CACHE_DIR,
+    FACT_CHECK_CACHE_TTL_SECONDS,
+    FACT_CHECK_CACHE_EMPTY_TTL_SECONDS,
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Fact-check lookups are independent HTTPS round-trips; check_claims overlaps
+# up to this many over one keep-alive connection pool.
+_FACT_CHECK_MAX_WORKERS = 32
+
+# Rating vocabularies, matched as whole words so "incorrect", "inaccurate" and
+# "untrue" are not read as their positive stems.
+_POSITIVE_RATING_RE = re.compile(r'\b(?:true|correct|accurate|verified|confirmed)\b')
+_NEGATIVE_RATING_RE = re.compile(
+    r'\b(?:false|incorrect|inaccurate|untrue|misleading|debunked|unproven)\b'
+)
+_DEFINITE_RATING_RE = re.compile(r'\b(?:true|false|correct|incorrect)\b')
+_PARTIAL_RATING_RE = re.compile(r'\b(?:mostly|partly|somewhat)\b')
+
 
 class TruthTableChecker:
     """Check claims against Google Fact Check API"""
     
-    def __init__(self, api_key: str = GOOGLE_FACT_CHECK_API_KEY):
+    def __init__(self, api_key: str = GOOGLE_FACT_CHECK_API_KEY, cache_dir: Optional[str] = None):
         self.api_key = api_key
+        if cache_dir is None and ENABLE_FACT_CHECK_CACHE:
+            cache_dir = FACT_CHECK_CACHE_DIR
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
         self.base_url = "https://factchecktools.googleapis.com/v1alpha1/claims:search"
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=_FACT_CHECK_MAX_WORKERS, pool_maxsize=_FACT_CHECK_MAX_WORKERS
+        )
+        self.session.mount("https://", adapter)
     
+    def check_claims(self, claim_texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Check several claims concurrently.
+        Returns one check_claim() result per claim, in the same order.
+        """
+        if not claim_texts:
+            return []
+        if len(claim_texts) == 1:
+            return [self.check_claim(claim_texts[0])]
+        workers = min(_FACT_CHECK_MAX_WORKERS, len(claim_texts))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.check_claim, claim_texts))
+
     def check_claim(self, claim_text: str) -> Dict[str, Any]:
         """
         Check if claim appears in Google Fact Check API.
@@ -31,16 +88,7 @@ class TruthTableChecker:
             }
         
         try:
-            params = {
-                'query': claim_text[:512],  # API has character limits
-                'key': self.api_key,
-                'languageCode': 'en'
-            }
-            
-            response = requests.get(self.base_url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self._query_fact_check(claim_text[:512])  # API has character limits
             
             if 'claims' not in data or len(data['claims']) == 0:
                 return {
@@ -104,6 +152,59 @@ class TruthTableChecker:
                 'sources': []
             }
     
+    def _query_fact_check(self, query: str) -> Dict[str, Any]:
+        """Raw claims:search response for query, served from the disk cache when fresh."""
+        cache_path = self._cache_path(query) if self.cache_dir is not None else None
+        if cache_path is not None:
+            cached = self._load_cached_response(cache_path)
+            if cached is not None:
+                return cached
+
+        params = {
+            'query': query,
+            'key': self.api_key,
+            'languageCode': 'en'
+        }
+        response = self.session.get(self.base_url, params=params, timeout=10)
+        response.raise_for_status()
+        data = _json_loads(response.content)
+
+        if cache_path is not None:
+            self._store_response(cache_path, data)
+        return data
+
+    def _cache_path(self, query: str) -> Path:
+        normalized = " ".join(query.lower().split())
+        key = hashlib.blake2b(normalized.encode("utf-8"), digest_size=20).hexdigest()
+        return self.cache_dir / f"{key}.json"
+
+    @staticmethod
+    def _load_cached_response(path: Path) -> Optional[Dict[str, Any]]:
+        """Cached response at path, or None if missing, unreadable or expired."""
+        if not path.exists():
+            return None
+        try:
+            entry = _json_loads(path.read_bytes())
+        except Exception as e:
+            logger.warning(f"Could not read fact-check cache {path}: {e}")
+            return None
+        data = entry.get('data') or {}
+        ttl = FACT_CHECK_CACHE_TTL_SECONDS if data.get('claims') else FACT_CHECK_CACHE_EMPTY_TTL_SECONDS
+        if time.time() - entry.get('stored_at', 0) > ttl:
+            return None
+        return data
+
+    @staticmethod
+    def _store_response(path: Path, data: Dict[str, Any]) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'stored_at': time.time(), 'data': data}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not write fact-check cache {path}: {e}")
+
     def _find_best_match(self, claims: List[Dict], query: str) -> Dict:
         """Find the claim that best matches the query"""
         # For now, just return the first claim
@@ -120,13 +221,11 @@ class TruthTableChecker:
         rating_lower = rating.lower()
         
         # Positive ratings
-        positive_keywords = ['true', 'correct', 'accurate', 'verified', 'confirmed', 'mostly true']
-        if any(keyword in rating_lower for keyword in positive_keywords):
+        if _POSITIVE_RATING_RE.search(rating_lower):
             return True
         
         # Negative ratings
-        negative_keywords = ['false', 'incorrect', 'inaccurate', 'misleading', 'debunked', 'unproven']
-        if any(keyword in rating_lower for keyword in negative_keywords):
+        if _NEGATIVE_RATING_RE.search(rating_lower):
             return False
         
         # Mixed/uncertain ratings - default to False for safety
@@ -137,10 +236,10 @@ class TruthTableChecker:
         rating_lower = rating.lower()
         
         # High confidence ratings
-        if any(word in rating_lower for word in ['true', 'false', 'correct', 'incorrect']):
+        if _DEFINITE_RATING_RE.search(rating_lower):
             base_confidence = 0.9
         # Medium confidence ratings
-        elif any(word in rating_lower for word in ['mostly', 'partly', 'somewhat']):
+        elif _PARTIAL_RATING_RE.search(rating_lower):
             base_confidence = 0.6
         # Low confidence ratings
         else: